@@ -21,6 +21,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
 import pandas as pd
 import pickle
+import joblib
 import json
 import warnings
 from sklearn.model_selection import train_test_split
@@ -137,6 +138,22 @@ def save_models(models, results):
     print("Model artifacts saved successfully!")
 
 
+def save_model_bundle(models, label_encoders):
+    """
+    Save models and label encoders together as a single joblib archive.
+
+    The ML service loads this one file (memory-mapped) instead of three
+    separate pickles, falling back to the pickles if it is missing.
+    """
+    lr_model, dt_model = models
+
+    joblib.dump(
+        {"lr": lr_model, "dt": dt_model, "enc": label_encoders},
+        os.path.join(MODELS_DIR, "models.joblib"),
+        compress=0,
+    )
+
+
 def main():
     """Main training pipeline."""
     print("🚢 TITANIC SURVIVAL PREDICTION - PRODUCTION TRAINING PIPELINE 🚢")
@@ -180,6 +197,9 @@ def main():
         # Save preprocessor artifacts
         preprocessor.save_artifacts(MODELS_DIR)
 
+        # Save combined archive for fast service startup
+        save_model_bundle(models, preprocessor.label_encoders)
+
         print("\n" + "=" * 80)
         print("🎉 TRAINING PIPELINE COMPLETED SUCCESSFULLY!")
         print("=" * 80)
@@ -187,6 +207,7 @@ def main():
         print("- logistic_model.pkl")
         print("- decision_tree_model.pkl")
         print("- label_encoders.pkl")
+        print("- models.joblib")
         print("- preprocessing_stats.json")
         print("- feature_columns.json")
         print("- evaluation_results.json")
@@ -25,6 +25,19 @@ class TokenData(BaseModel):
     iat: datetime
 
 
+def _load_key(algorithm: str, key: str) -> Any:
+    """
+    Parse a configured key once for the given JWT algorithm.
+
+    PyJWT otherwise re-parses PEM keys on every encode/decode. Keys that fail
+    to parse are returned unchanged, so the error still surfaces on use.
+    """
+    try:
+        return jwt.algorithms.get_default_algorithms()[algorithm].prepare_key(key)
+    except (KeyError, ValueError, TypeError, jwt.InvalidKeyError):
+        return key
+
+
 class AuthService:
     """Handles JWT authentication operations."""
 
@@ -44,8 +57,9 @@ class AuthService:
         if not self._initialized:
             self.config = config_manager.config
             self.algorithm = self.config.jwt.algorithm
-            self.private_key = self.config.jwt.private_key
-            self.public_key = self.config.jwt.public_key
+            # Keys are parsed once here rather than on every token operation
+            self.private_key = _load_key(self.algorithm, self.config.jwt.private_key)
+            self.public_key = _load_key(self.algorithm, self.config.jwt.public_key)
             self.expire_minutes = self.config.jwt.access_token_expire_minutes
             self._initialized = True
 
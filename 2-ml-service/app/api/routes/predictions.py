@@ -149,18 +149,18 @@ async def predict_survival(
         sanitized_data = validate_passenger_input(passenger_data)
 
         # Make prediction (models loaded on first call)
-        prediction_start = time.time()
+        prediction_start_ns = time.perf_counter_ns()
         prediction = await ml_service.predict_survival(sanitized_data)
-        prediction_time = (time.time() - prediction_start) * 1000
+        prediction_ns = time.perf_counter_ns() - prediction_start_ns
 
-        # Log only if slow or first request
-        if prediction_time > 200:
+        # Log only if slow (>200ms) or first request
+        if prediction_ns > 200_000_000:
             logger.info(
                 "Prediction completed",
                 request_id=request_id,
                 user_id=current_user["user_id"],
-                duration_ms=round(prediction_time, 2),
-                models_lazy_loaded=(prediction_time > 1000),
+                duration_ms=round(prediction_ns / 1e6, 2),
+                models_lazy_loaded=(prediction_ns > 1_000_000_000),
             )
 
         return prediction
@@ -17,7 +17,13 @@ from .exceptions import (
     handle_pydantic_validation_error,
     create_error_response,
 )
-from .logging_config import setup_structured_logging, get_logger, StructuredLogger
+from .logging_config import (
+    setup_structured_logging,
+    start_log_queue,
+    stop_log_queue,
+    get_logger,
+    StructuredLogger,
+)
 
 __all__ = [
     "config_manager",
@@ -29,6 +35,8 @@ __all__ = [
     "handle_pydantic_validation_error",
     "create_error_response",
     "setup_structured_logging",
+    "start_log_queue",
+    "stop_log_queue",
     "get_logger",
     "StructuredLogger",
 ]
@@ -7,9 +7,12 @@ support for environment variable overrides and validation.
 
 import os
 import yaml
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from pydantic import BaseModel, Field
 
+# libyaml's C loader when PyYAML was built with it, pure-Python otherwise
+_YamlSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class ModelsConfig(BaseModel):
     """Model-related configuration."""
@@ -44,6 +47,10 @@ class APIConfig(BaseModel):
     cors_origins: List[str] = Field(
         default=["http://localhost:3000"], description="CORS allowed origins"
     )
+    docs_enabled: Optional[bool] = Field(
+        default=None,
+        description="Serve /docs, /redoc and /openapi.json (default: off in production)",
+    )
 
 
 class LoggingConfig(BaseModel):
@@ -118,7 +125,7 @@ class ConfigManager:
         self.config_file = config_file
         self._config: Config = None
 
-    def load_config(self) -> Config:
+    def load_config(self, reload: bool = False) -> Config:
         """
         Load configuration with the following priority:
         1. Environment variables (highest priority)
@@ -126,6 +133,11 @@ class ConfigManager:
         3. Default configuration (fallback)
 
         This approach works for local dev, CI/CD, and production deployments.
+        The validated configuration is cached, so later calls return it
+        without re-reading or re-validating anything.
+
+        Args:
+            reload: Re-read and re-validate even if already loaded
 
         Returns:
             Config: Loaded and validated configuration
@@ -133,6 +145,9 @@ class ConfigManager:
         Raises:
             Exception: If config is invalid
         """
+        if self._config is not None and not reload:
+            return self._config
+
         config_data = None
         config_source = None
 
@@ -144,7 +159,7 @@ class ConfigManager:
         if os.path.exists(self.config_file):
             try:
                 with open(self.config_file, "r") as f:
-                    file_config = yaml.safe_load(f)
+                    file_config = yaml.load(f, Loader=_YamlSafeLoader)  # nosec B506 - safe loader
                     # Deep merge file config into defaults
                     config_data = self._deep_merge(config_data, file_config)
                     config_source = f"{self.config_file}"
@@ -205,6 +220,7 @@ class ConfigManager:
             "JWT_EXPIRE_MINUTES": ["jwt", "access_token_expire_minutes"],
             "RATE_LIMITING_BACKEND": ["rate_limiting", "storage_backend"],
             "REDIS_URL": ["rate_limiting", "redis", "url"],
+            "API_DOCS_ENABLED": ["api", "docs_enabled"],
         }
 
         for env_var, config_path in env_mappings.items():
@@ -221,7 +237,7 @@ class ConfigManager:
                 final_key = config_path[-1]
                 if final_key == "port" or final_key == "access_token_expire_minutes":
                     current[final_key] = int(env_value)
-                elif final_key == "reload":
+                elif final_key in ("reload", "docs_enabled"):
                     current[final_key] = env_value.lower() in ("true", "1", "yes")
                 else:
                     current[final_key] = env_value
@@ -8,10 +8,33 @@ The JSON output is automatically captured and parsed by modern cloud platforms.
 
 import structlog
 import logging
+import queue
 import sys
-from typing import Any, Dict
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Callable, Dict, Optional
 from datetime import datetime, timezone
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+
+def _orjson_dumps(obj: Any, default: Any = None, **kwargs: Any) -> str:
+    """Serialize a log entry with orjson, keys sorted like json.dumps."""
+    return orjson.dumps(obj, default=default, option=orjson.OPT_SORT_KEYS).decode()
+
+
+def _json_renderer() -> structlog.processors.JSONRenderer:
+    """JSON renderer using orjson when installed, stdlib json otherwise."""
+    if orjson is not None:
+        return structlog.processors.JSONRenderer(serializer=_orjson_dumps)
+    return structlog.processors.JSONRenderer(sort_keys=True)
+
+
+# Log records buffered for the background writer before new ones are dropped
+LOG_QUEUE_SIZE = 10000
+
 
 def add_timestamp(
     logger: Any, method_name: str, event_dict: Dict[str, Any]
@@ -111,7 +134,7 @@ def setup_structured_logging(
             "environment": environment,
         },
         # Convert to JSON for output
-        structlog.processors.JSONRenderer(sort_keys=True),
+        _json_renderer(),
     ]
 
     # Configure structlog
@@ -124,6 +147,86 @@ def setup_structured_logging(
     )
 
 
+class _DroppingQueueHandler(QueueHandler):
+    """QueueHandler that drops records when the queue is full instead of erroring."""
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+
+class _LogQueueListener(QueueListener):
+    """QueueListener whose stop() waits for room in a full queue."""
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+# Stops the running log queue listener; None while logging goes straight out
+_stop_log_queue: Optional[Callable[[], None]] = None
+
+
+def start_log_queue(maxsize: int = LOG_QUEUE_SIZE) -> Optional[Callable[[], None]]:
+    """
+    Move root stdout logging onto a background thread.
+
+    The root logger's stream handlers are replaced by a bounded queue, and a
+    QueueListener writes queued records through them, so logging calls never
+    block on a slow stdout. Call the returned function, or stop_log_queue(),
+    at shutdown to flush pending records and put the stream handlers back on
+    the root logger.
+
+    The listener is kept here rather than by the caller, so starting again
+    while it runs (e.g. when main is imported both as __main__ and as main)
+    returns the running listener's stop function.
+
+    Args:
+        maxsize: Queue capacity; records logged while it is full are dropped
+
+    Returns:
+        A function stopping the listener, or None if there was no stream
+        handler to move
+    """
+    global _stop_log_queue
+    if _stop_log_queue is not None:
+        return _stop_log_queue
+
+    root = logging.getLogger()
+    handlers = [h for h in root.handlers if type(h) is logging.StreamHandler]
+    if not handlers:
+        return None
+
+    log_queue = queue.Queue(maxsize=maxsize)
+    queue_handler = _DroppingQueueHandler(log_queue)
+    for handler in handlers:
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+
+    listener = _LogQueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+
+    def stop() -> None:
+        global _stop_log_queue
+        if _stop_log_queue is not stop:
+            return
+        _stop_log_queue = None
+        root.removeHandler(queue_handler)
+        listener.stop()
+        for handler in handlers:
+            root.addHandler(handler)
+
+    _stop_log_queue = stop
+    return stop
+
+
+def stop_log_queue() -> None:
+    """Stop the log queue listener, if running, flushing it to stdout."""
+    if _stop_log_queue is not None:
+        _stop_log_queue()
+
+
 def get_logger(component: str = None) -> structlog.stdlib.BoundLogger:
     """
     Get a configured structured logger.
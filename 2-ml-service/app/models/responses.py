@@ -6,11 +6,14 @@ and well-documented output formats.
 """
 
 from pydantic import BaseModel, Field, ConfigDict
-from typing import Dict
+from pydantic.dataclasses import dataclass
+from typing import Dict, Optional
 
 
 class ModelPrediction(BaseModel):
     """Individual model prediction result."""
+
+    model_config = ConfigDict(frozen=True)
     
     probability: float = Field(
         ..., 
@@ -28,6 +31,8 @@ class ModelPrediction(BaseModel):
 
 class EnsemblePrediction(BaseModel):
     """Ensemble model prediction with confidence metrics."""
+
+    model_config = ConfigDict(frozen=True)
     
     probability: float = Field(
         ..., 
@@ -57,7 +62,12 @@ class EnsemblePrediction(BaseModel):
 
 
 class PredictionResponse(BaseModel):
-    """Complete prediction response with individual and ensemble results."""
+    """
+    Complete prediction response with individual and ensemble results.
+
+    The ML services build it and its nested predictions with model_construct,
+    skipping validation, since the probabilities come from our own models.
+    """
     
     individual_models: Dict[str, ModelPrediction] = Field(
         ..., 
@@ -70,6 +80,7 @@ class PredictionResponse(BaseModel):
     )
 
     model_config = ConfigDict(
+        frozen=True,
         json_schema_extra={
             "example": {
                 "individual_models": {
@@ -93,20 +104,11 @@ class PredictionResponse(BaseModel):
     )
 
 
-class HealthResponse(BaseModel):
-    """Health check response model."""
-    
-    status: str = Field(..., description="Service health status")
-    models_loaded: bool = Field(..., description="Whether ML models are loaded")
-    preprocessor_ready: bool = Field(..., description="Whether preprocessor is ready")
-    
-    model_accuracy: Dict[str, float] = Field(
-        None, 
-        description="Model accuracy metrics from training"
-    )
-
-    model_config = ConfigDict(
-        protected_namespaces=(),  # Disable protected namespaces to allow 'model_' fields
+@dataclass(
+    frozen=True,
+    slots=True,
+    config=ConfigDict(
+        extra="forbid",
         json_schema_extra={
             "example": {
                 "status": "healthy",
@@ -118,7 +120,24 @@ class HealthResponse(BaseModel):
                     "ensemble": 0.817
                 }
             }
-        }
+        },
+    ),
+)
+class HealthResponse:
+    """
+    Health check response model.
+
+    Only used as a response envelope, so it is a slotted pydantic dataclass
+    rather than a BaseModel: no per-instance __dict__ and no model methods.
+    """
+    
+    status: str = Field(..., description="Service health status")
+    models_loaded: bool = Field(..., description="Whether ML models are loaded")
+    preprocessor_ready: bool = Field(..., description="Whether preprocessor is ready")
+    
+    model_accuracy: Optional[Dict[str, float]] = Field(
+        None, 
+        description="Model accuracy metrics from training"
     )
 
 
@@ -0,0 +1,234 @@
+"""
+Process-wide registry of deserialized model artifacts.
+
+Both ML service implementations load the same pickled models and evaluation
+results. Loading them through this registry keeps a single parsed copy of
+each file in memory, no matter how many service instances exist in the process.
+The module also holds what both services need to use those artifacts: the
+model input columns, the prediction kernels compiled from the fitted models,
+and the sys.path setup for the shared preprocessor package.
+"""
+
+import os
+import sys
+import json
+import mmap
+import pickle  # nosec B403 - used only for internal ML model files
+import threading
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    _json_loads = json.loads
+
+# Single-file archive of {"lr", "dt", "enc"} written by the training pipeline;
+# services fall back to the individual .pkl files when it is absent
+MODEL_BUNDLE_FILENAME = "models.joblib"
+
+# Model input columns in training order (matches feature_columns.json)
+FEATURE_COLUMNS = (
+    "pclass",
+    "sex",
+    "age",
+    "sibsp",
+    "parch",
+    "fare",
+    "embarked",
+    "family_size",
+    "is_alone",
+    "age_group",
+)
+
+# Repository root (the container root in the Docker image), where the shared
+# preprocessor package lives
+_PROJECT_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "..")
+)
+
+# Absolute path -> (st_mtime_ns at load time, deserialized object)
+_REGISTRY: dict[str, tuple[int, Any]] = {}
+_lock = threading.Lock()
+
+
+def load_pickle(filepath: str) -> Any:
+    """
+    Deserialize an internal model artifact from a read-only memory map.
+
+    Unpickling from one contiguous mapped buffer avoids the chunked reads and
+    intermediate copies of pickle.load on a buffered file object.
+    """
+    with (
+        open(filepath, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+    ):
+        return pickle.loads(mm)  # nosec B301 - internal model files only
+
+
+def load_json(filepath: str) -> Any:
+    """Parse a JSON artifact from raw bytes, using orjson when installed."""
+    with open(filepath, "rb") as f:
+        return _json_loads(f.read())
+
+
+def load_joblib(filepath: str) -> Any:
+    """
+    Load a joblib archive with its numpy arrays memory-mapped read-only.
+
+    One archive replaces several open/unpickle sequences, and mmap_mode lets
+    the OS page model weights in lazily instead of copying them.
+    """
+    import joblib
+
+    return joblib.load(filepath, mmap_mode="r")  # nosec B301 - internal models
+
+
+def _get_cached(filepath: str, loader: Callable[[str], Any]) -> Any:
+    """Return the registry entry for filepath, loading it if missing or stale."""
+    path = os.path.abspath(filepath)
+    mtime_ns = os.stat(path).st_mtime_ns
+
+    entry = _REGISTRY.get(path)
+    if entry is not None and entry[0] == mtime_ns:
+        return entry[1]
+
+    with _lock:
+        entry = _REGISTRY.get(path)
+        if entry is not None and entry[0] == mtime_ns:
+            return entry[1]
+
+        value = loader(path)
+        _REGISTRY[path] = (mtime_ns, value)
+        return value
+
+
+def get_model(filepath: str) -> Any:
+    """
+    Get a deserialized model artifact, loading it on first request.
+
+    Entries are keyed by absolute path and invalidated when the file's
+    modification time changes, so redeployed models are picked up.
+
+    Args:
+        filepath: Path to the pickled artifact
+
+    Returns:
+        The shared deserialized object
+    """
+    return _get_cached(filepath, load_pickle)
+
+
+def get_json(filepath: str) -> Any:
+    """
+    Get a parsed JSON artifact (e.g. evaluation results), cached like get_model.
+
+    Callers must treat the returned object as read-only since it is shared.
+
+    Args:
+        filepath: Path to the JSON file
+
+    Returns:
+        The shared parsed object
+    """
+    return _get_cached(filepath, load_json)
+
+
+def get_model_bundle(filepath: str) -> dict[str, Any]:
+    """
+    Get the combined model archive, cached like get_model.
+
+    Args:
+        filepath: Path to the models.joblib archive
+
+    Returns:
+        Dict with "lr", "dt" and "enc" (label encoders) entries
+    """
+    return _get_cached(filepath, load_joblib)
+
+
+def evict(filepath: Optional[str] = None) -> None:
+    """
+    Drop registry entries so the next lookup reloads from disk.
+
+    Args:
+        filepath: Artifact to evict; evicts everything when omitted
+    """
+    with _lock:
+        if filepath is None:
+            _REGISTRY.clear()
+        else:
+            _REGISTRY.pop(os.path.abspath(filepath), None)
+
+
+def ensure_shared_importable() -> None:
+    """Make the shared preprocessor package importable (idempotent)."""
+    if "shared" not in sys.modules and _PROJECT_ROOT not in sys.path:
+        sys.path.append(_PROJECT_ROOT)
+
+
+def compile_logistic(lr_model):
+    """
+    Build a survival-probability kernel for a fitted binary LogisticRegression.
+
+    Equivalent to lr_model.predict_proba(X)[:, 1], with the fitted weights
+    captured once. This skips sklearn's per-call input validation and
+    multiclass handling, which dominate the cost of scoring a few rows.
+
+    Args:
+        lr_model: Fitted binary LogisticRegression
+
+    Returns:
+        Function mapping a 2-D feature array to 1-D survival probabilities
+    """
+    from scipy.special import expit
+
+    weights = lr_model.coef_[0].copy()
+    bias = float(lr_model.intercept_[0])
+
+    def predict(features):
+        return expit(features @ weights + bias)
+
+    return predict
+
+
+def compile_decision_tree(dt_model):
+    """
+    Build a survival-probability kernel for a fitted binary DecisionTreeClassifier.
+
+    Equivalent to dt_model.predict_proba(X)[:, 1]. The tree arrays and the
+    survival fraction of every leaf are extracted once, and rows are routed
+    with a plain Python walk (the tree is shallow, max_depth=10).
+
+    Args:
+        dt_model: Fitted binary DecisionTreeClassifier
+
+    Returns:
+        Function mapping a 2-D feature array to 1-D survival probabilities
+    """
+    import numpy as np
+
+    tree = dt_model.tree_
+    children_left = tree.children_left.tolist()
+    children_right = tree.children_right.tolist()
+    feature = tree.feature.tolist()
+    threshold = tree.threshold.tolist()
+    class_values = tree.value[:, 0, :]
+    survival = (class_values[:, 1] / class_values.sum(axis=1)).tolist()
+
+    def predict(features):
+        # sklearn compares float32 features against the split thresholds
+        rows = np.asarray(features, dtype=np.float32).tolist()
+        probabilities = []
+        for row in rows:
+            node = 0
+            while children_left[node] != -1:
+                if row[feature[node]] <= threshold[node]:
+                    node = children_left[node]
+                else:
+                    node = children_right[node]
+            probabilities.append(survival[node])
+        return probabilities
+
+    return predict
@@ -10,14 +10,54 @@ import time
 import os
 import psutil
 import asyncio
-from typing import Dict, Any
+from dataclasses import dataclass
+from typing import Dict, Any, Optional
 from datetime import datetime, timezone
 from enum import Enum
 
-from app.core.logging_config import get_logger, StructuredLogger
+from app.core.logging_config import get_logger
 from app.services.lazy_ml_service import fast_ml_service as ml_service
 from app.core.config import config_manager
 
+# Constant check inputs, built once at import instead of on every health call
+_CRITICAL_SECTIONS = frozenset({"api", "jwt", "logging"})
+_REQUIRED_STATS = frozenset({"age_median", "embarked_mode", "fare_median"})
+_REQUIRED_MODEL_FILES = frozenset(
+    {
+        "logistic_model.pkl",
+        "decision_tree_model.pkl",
+        "evaluation_results.json",
+        "label_encoders.pkl",
+    }
+)
+
+
+def _utc_timestamp() -> str:
+    """Current wall-clock time as an ISO 8601 UTC string with a Z suffix."""
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+@dataclass(frozen=True)
+class CheckContext:
+    """
+    Clock readings shared by every check in a single health-check run.
+
+    Reading the clocks once per run keeps all check timestamps identical and
+    reports each check duration relative to the start of the run.
+    """
+
+    start_ns: int
+    timestamp: str
+
+    @classmethod
+    def start(cls) -> "CheckContext":
+        """Capture the monotonic start time and wall-clock timestamp."""
+        return cls(start_ns=time.monotonic_ns(), timestamp=_utc_timestamp())
+
+    def elapsed_ms(self) -> float:
+        """Milliseconds elapsed since the run started."""
+        return (time.monotonic_ns() - self.start_ns) / 1e6
+
 
 class HealthStatus(str, Enum):
     """Health status levels."""
@@ -27,6 +67,23 @@ class HealthStatus(str, Enum):
     UNHEALTHY = "unhealthy"
 
 
+# Position of each status in the run_all_checks counters
+_STATUS_INDEX = {
+    HealthStatus.HEALTHY: 0,
+    HealthStatus.DEGRADED: 1,
+    HealthStatus.UNHEALTHY: 2,
+}
+
+# Names of the checks run_all_checks gathers, in the order it runs them
+_CHECK_NAMES = (
+    "ml_models",
+    "preprocessor",
+    "configuration",
+    "system_resources",
+    "model_files",
+)
+
+
 class HealthCheck:
     """Individual health check result."""
 
@@ -37,13 +94,14 @@ class HealthCheck:
         message: str = "",
         details: Dict[str, Any] = None,
         duration_ms: float = None,
+        timestamp: str = None,
     ):
         self.name = name
         self.status = status
         self.message = message
         self.details = details or {}
         self.duration_ms = duration_ms
-        self.timestamp = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        self.timestamp = timestamp or _utc_timestamp()
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation."""
@@ -74,7 +132,6 @@ class EnhancedHealthChecker:
 
     def __init__(self):
         self.logger = get_logger("health_checker")
-        self.structured_logger = StructuredLogger("health_checker")
 
     async def run_startup_checks(self) -> Dict[str, Any]:
         """
@@ -89,16 +146,16 @@ class EnhancedHealthChecker:
         Raises:
             Exception: If any critical startup check fails
         """
-        start_time = time.time()
+        ctx = CheckContext.start()
 
         self.logger.info("Running startup health checks", health_check_phase="startup")
 
         # Critical startup checks (must pass)
         startup_checks = [
-            ("ml_models", self.check_ml_models()),
-            ("preprocessor", self.check_preprocessor()),
-            ("configuration", self.check_configuration()),
-            ("model_files", self.check_model_files()),
+            ("ml_models", self.check_ml_models(ctx)),
+            ("preprocessor", self.check_preprocessor(ctx)),
+            ("configuration", self.check_configuration(ctx)),
+            ("model_files", self.check_model_files(ctx)),
         ]
 
         results = {}
@@ -120,9 +177,10 @@ class EnhancedHealthChecker:
                     status=HealthStatus.UNHEALTHY,
                     message=error_msg,
                     details={"error": str(e), "error_type": type(e).__name__},
+                    timestamp=ctx.timestamp,
                 ).to_dict()
 
-        total_duration = (time.time() - start_time) * 1000
+        total_duration = ctx.elapsed_ms()
 
         if failed_checks:
             error_message = f"Startup checks failed: {'; '.join(failed_checks)}"
@@ -146,14 +204,14 @@ class EnhancedHealthChecker:
         return {
             "status": "startup_success",
             "message": "All critical dependencies validated",
-            "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+            "timestamp": ctx.timestamp,
             "duration_ms": round(total_duration, 2),
             "checks": results,
         }
 
-    async def check_ml_models(self) -> HealthCheck:
+    async def check_ml_models(self, ctx: Optional[CheckContext] = None) -> HealthCheck:
         """Check ML models status and performance."""
-        start_time = time.time()
+        ctx = ctx or CheckContext.start()
 
         try:
             # Check if models are loaded
@@ -162,7 +220,8 @@ class EnhancedHealthChecker:
                     name="ml_models",
                     status=HealthStatus.UNHEALTHY,
                     message="ML models not loaded",
-                    duration_ms=(time.time() - start_time) * 1000,
+                    duration_ms=ctx.elapsed_ms(),
+                    timestamp=ctx.timestamp,
                 )
 
             # Check model accuracy
@@ -187,7 +246,8 @@ class EnhancedHealthChecker:
                     status=HealthStatus.DEGRADED,
                     message=f"Models with low accuracy: {low_accuracy_models}",
                     details=details,
-                    duration_ms=(time.time() - start_time) * 1000,
+                    duration_ms=ctx.elapsed_ms(),
+                    timestamp=ctx.timestamp,
                 )
 
             return HealthCheck(
@@ -195,7 +255,8 @@ class EnhancedHealthChecker:
                 status=HealthStatus.HEALTHY,
                 message="All models loaded and performing well",
                 details=details,
-                duration_ms=(time.time() - start_time) * 1000,
+                duration_ms=ctx.elapsed_ms(),
+                timestamp=ctx.timestamp,
             )
 
         except Exception as e:
@@ -204,12 +265,15 @@ class EnhancedHealthChecker:
                 status=HealthStatus.UNHEALTHY,
                 message=f"Model health check failed: {str(e)}",
                 details={"error": str(e), "error_type": type(e).__name__},
-                duration_ms=(time.time() - start_time) * 1000,
+                duration_ms=ctx.elapsed_ms(),
+                timestamp=ctx.timestamp,
             )
 
-    async def check_preprocessor(self) -> HealthCheck:
+    async def check_preprocessor(
+        self, ctx: Optional[CheckContext] = None
+    ) -> HealthCheck:
         """Check preprocessor status and integrity."""
-        start_time = time.time()
+        ctx = ctx or CheckContext.start()
 
         try:
             if not ml_service.preprocessor:
@@ -217,18 +281,18 @@ class EnhancedHealthChecker:
                     name="preprocessor",
                     status=HealthStatus.UNHEALTHY,
                     message="Preprocessor not loaded",
-                    duration_ms=(time.time() - start_time) * 1000,
+                    duration_ms=ctx.elapsed_ms(),
+                    timestamp=ctx.timestamp,
                 )
 
             # Check if preprocessing stats are available
             stats = ml_service.preprocessor.preprocessing_stats
-            required_stats = ["age_median", "embarked_mode", "fare_median"]
-            missing_stats = [stat for stat in required_stats if stat not in stats]
+            missing_stats = sorted(_REQUIRED_STATS - stats.keys())
 
             details = {
                 "preprocessing_stats": stats,
                 "stats_available": len(stats),
-                "required_stats": required_stats,
+                "required_stats": sorted(_REQUIRED_STATS),
                 "missing_stats": missing_stats,
             }
 
@@ -238,7 +302,8 @@ class EnhancedHealthChecker:
                     status=HealthStatus.DEGRADED,
                     message=f"Missing preprocessing stats: {missing_stats}",
                     details=details,
-                    duration_ms=(time.time() - start_time) * 1000,
+                    duration_ms=ctx.elapsed_ms(),
+                    timestamp=ctx.timestamp,
                 )
 
             return HealthCheck(
@@ -246,7 +311,8 @@ class EnhancedHealthChecker:
                 status=HealthStatus.HEALTHY,
                 message="Preprocessor ready with all required statistics",
                 details=details,
-                duration_ms=(time.time() - start_time) * 1000,
+                duration_ms=ctx.elapsed_ms(),
+                timestamp=ctx.timestamp,
             )
 
         except Exception as e:
@@ -255,12 +321,15 @@ class EnhancedHealthChecker:
                 status=HealthStatus.UNHEALTHY,
                 message=f"Preprocessor health check failed: {str(e)}",
                 details={"error": str(e), "error_type": type(e).__name__},
-                duration_ms=(time.time() - start_time) * 1000,
+                duration_ms=ctx.elapsed_ms(),
+                timestamp=ctx.timestamp,
             )
 
-    async def check_configuration(self) -> HealthCheck:
+    async def check_configuration(
+        self, ctx: Optional[CheckContext] = None
+    ) -> HealthCheck:
         """Check configuration status and validity."""
-        start_time = time.time()
+        ctx = ctx or CheckContext.start()
 
         try:
             config = config_manager.config
@@ -270,14 +339,16 @@ class EnhancedHealthChecker:
                     name="configuration",
                     status=HealthStatus.UNHEALTHY,
                     message="Configuration not loaded",
-                    duration_ms=(time.time() - start_time) * 1000,
+                    duration_ms=ctx.elapsed_ms(),
+                    timestamp=ctx.timestamp,
                 )
 
             # Check critical configuration sections
-            critical_sections = ["api", "jwt", "logging"]
-            missing_sections = [
-                section for section in critical_sections if not hasattr(config, section)
-            ]
+            missing_sections = sorted(
+                section
+                for section in _CRITICAL_SECTIONS
+                if not hasattr(config, section)
+            )
 
             # Check JWT configuration
             jwt_issues = []
@@ -293,9 +364,9 @@ class EnhancedHealthChecker:
                 "environment": config.environment
                 if hasattr(config, "environment")
                 else "unknown",
-                "critical_sections_available": len(critical_sections)
+                "critical_sections_available": len(_CRITICAL_SECTIONS)
                 - len(missing_sections),
-                "critical_sections_total": len(critical_sections),
+                "critical_sections_total": len(_CRITICAL_SECTIONS),
                 "missing_sections": missing_sections,
                 "jwt_configuration": {
                     "algorithm": config.jwt.algorithm
@@ -311,7 +382,8 @@ class EnhancedHealthChecker:
                     status=HealthStatus.DEGRADED,
                     message=f"Configuration issues detected: {missing_sections + jwt_issues}",
                     details=details,
-                    duration_ms=(time.time() - start_time) * 1000,
+                    duration_ms=ctx.elapsed_ms(),
+                    timestamp=ctx.timestamp,
                 )
 
             return HealthCheck(
@@ -319,7 +391,8 @@ class EnhancedHealthChecker:
                 status=HealthStatus.HEALTHY,
                 message="Configuration loaded and valid",
                 details=details,
-                duration_ms=(time.time() - start_time) * 1000,
+                duration_ms=ctx.elapsed_ms(),
+                timestamp=ctx.timestamp,
             )
 
         except Exception as e:
@@ -328,12 +401,15 @@ class EnhancedHealthChecker:
                 status=HealthStatus.UNHEALTHY,
                 message=f"Configuration health check failed: {str(e)}",
                 details={"error": str(e), "error_type": type(e).__name__},
-                duration_ms=(time.time() - start_time) * 1000,
+                duration_ms=ctx.elapsed_ms(),
+                timestamp=ctx.timestamp,
             )
 
-    async def check_system_resources(self) -> HealthCheck:
+    async def check_system_resources(
+        self, ctx: Optional[CheckContext] = None
+    ) -> HealthCheck:
         """Check system resource usage (CPU, memory, disk)."""
-        start_time = time.time()
+        ctx = ctx or CheckContext.start()
 
         try:
             # Get system metrics
@@ -384,7 +460,8 @@ class EnhancedHealthChecker:
                     status=HealthStatus.UNHEALTHY,
                     message=f"Critical resource usage: {', '.join(critical_issues)}",
                     details=details,
-                    duration_ms=(time.time() - start_time) * 1000,
+                    duration_ms=ctx.elapsed_ms(),
+                    timestamp=ctx.timestamp,
                 )
 
             # Check for warning-level resource usage
@@ -402,7 +479,8 @@ class EnhancedHealthChecker:
                     status=HealthStatus.DEGRADED,
                     message=f"High resource usage: {', '.join(warning_issues)}",
                     details=details,
-                    duration_ms=(time.time() - start_time) * 1000,
+                    duration_ms=ctx.elapsed_ms(),
+                    timestamp=ctx.timestamp,
                 )
 
             return HealthCheck(
@@ -410,7 +488,8 @@ class EnhancedHealthChecker:
                 status=HealthStatus.HEALTHY,
                 message="System resources within normal limits",
                 details=details,
-                duration_ms=(time.time() - start_time) * 1000,
+                duration_ms=ctx.elapsed_ms(),
+                timestamp=ctx.timestamp,
             )
 
         except Exception as e:
@@ -419,22 +498,20 @@ class EnhancedHealthChecker:
                 status=HealthStatus.UNHEALTHY,
                 message=f"System resource check failed: {str(e)}",
                 details={"error": str(e), "error_type": type(e).__name__},
-                duration_ms=(time.time() - start_time) * 1000,
+                duration_ms=ctx.elapsed_ms(),
+                timestamp=ctx.timestamp,
             )
 
-    async def check_model_files(self) -> HealthCheck:
+    async def check_model_files(
+        self, ctx: Optional[CheckContext] = None
+    ) -> HealthCheck:
         """Check that required model files exist and are accessible."""
-        start_time = time.time()
+        ctx = ctx or CheckContext.start()
 
         try:
             models_dir = ml_service.models_dir
 
-            required_files = [
-                "logistic_model.pkl",
-                "decision_tree_model.pkl",
-                "evaluation_results.json",
-                "label_encoders.pkl",
-            ]
+            required_files = sorted(_REQUIRED_MODEL_FILES)
 
             file_status = {}
             missing_files = []
@@ -474,7 +551,8 @@ class EnhancedHealthChecker:
                     status=HealthStatus.UNHEALTHY,
                     message=f"Missing required model files: {missing_files}",
                     details=details,
-                    duration_ms=(time.time() - start_time) * 1000,
+                    duration_ms=ctx.elapsed_ms(),
+                    timestamp=ctx.timestamp,
                 )
 
             return HealthCheck(
@@ -482,7 +560,8 @@ class EnhancedHealthChecker:
                 status=HealthStatus.HEALTHY,
                 message="All required model files are present and accessible",
                 details=details,
-                duration_ms=(time.time() - start_time) * 1000,
+                duration_ms=ctx.elapsed_ms(),
+                timestamp=ctx.timestamp,
             )
 
         except Exception as e:
@@ -491,7 +570,8 @@ class EnhancedHealthChecker:
                 status=HealthStatus.UNHEALTHY,
                 message=f"Model files check failed: {str(e)}",
                 details={"error": str(e), "error_type": type(e).__name__},
-                duration_ms=(time.time() - start_time) * 1000,
+                duration_ms=ctx.elapsed_ms(),
+                timestamp=ctx.timestamp,
             )
 
     async def run_all_checks(self) -> Dict[str, Any]:
@@ -501,43 +581,43 @@ class EnhancedHealthChecker:
         Returns:
             Dict containing overall status and individual check results
         """
-        start_time = time.time()
+        ctx = CheckContext.start()
 
-        self.structured_logger.logger.info(
+        self.logger.info(
             "Starting comprehensive health check", health_check_type="comprehensive"
         )
 
         # Run all health checks concurrently
         checks = await asyncio.gather(
-            self.check_ml_models(),
-            self.check_preprocessor(),
-            self.check_configuration(),
-            self.check_system_resources(),
-            self.check_model_files(),
+            self.check_ml_models(ctx),
+            self.check_preprocessor(ctx),
+            self.check_configuration(ctx),
+            self.check_system_resources(ctx),
+            self.check_model_files(ctx),
             return_exceptions=True,
         )
 
-        # Process results
-        results = {}
-        unhealthy_count = 0
-        degraded_count = 0
+        # Replace unexpected errors in health checks with unhealthy results,
+        # keyed per check so several failures don't share one entry
+        checks = [
+            HealthCheck(
+                name=f"{check_name}_error",
+                status=HealthStatus.UNHEALTHY,
+                message=f"Health check failed: {str(check)}",
+                details={"error": str(check), "error_type": type(check).__name__},
+                timestamp=ctx.timestamp,
+            )
+            if isinstance(check, Exception)
+            else check
+            for check_name, check in zip(_CHECK_NAMES, checks)
+        ]
 
+        # Process results in a single pass, counting by status index
+        results = {check.name: check.to_dict() for check in checks}
+        counters = [0, 0, 0]
         for check in checks:
-            if isinstance(check, Exception):
-                # Handle unexpected errors in health checks
-                results["health_check_error"] = HealthCheck(
-                    name="health_check_error",
-                    status=HealthStatus.UNHEALTHY,
-                    message=f"Health check failed: {str(check)}",
-                    details={"error": str(check), "error_type": type(check).__name__},
-                ).to_dict()
-                unhealthy_count += 1
-            else:
-                results[check.name] = check.to_dict()
-                if check.status == HealthStatus.UNHEALTHY:
-                    unhealthy_count += 1
-                elif check.status == HealthStatus.DEGRADED:
-                    degraded_count += 1
+            counters[_STATUS_INDEX[check.status]] += 1
+        healthy_count, degraded_count, unhealthy_count = counters
 
         # Determine overall status
         if unhealthy_count > 0:
@@ -550,10 +630,10 @@ class EnhancedHealthChecker:
             overall_status = HealthStatus.HEALTHY
             overall_message = "All systems operational"
 
-        total_duration = (time.time() - start_time) * 1000
+        total_duration = ctx.elapsed_ms()
 
         # Log health check completion
-        self.structured_logger.logger.info(
+        self.logger.info(
             "Health check completed",
             overall_status=overall_status.value,
             checks_run=len(results),
@@ -565,11 +645,11 @@ class EnhancedHealthChecker:
         return {
             "status": overall_status.value,
             "message": overall_message,
-            "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+            "timestamp": ctx.timestamp,
             "duration_ms": round(total_duration, 2),
             "summary": {
-                "total_checks": len(results),
-                "healthy": len(results) - unhealthy_count - degraded_count,
+                "total_checks": sum(counters),
+                "healthy": healthy_count,
                 "degraded": degraded_count,
                 "unhealthy": unhealthy_count,
             },
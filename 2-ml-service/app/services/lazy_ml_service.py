@@ -6,10 +6,9 @@ by deferring expensive operations until they're actually needed.
 """
 
 import os
-import pickle  # nosec B403 - used only for internal ML model files
-import json
-from typing import Dict, Any
-from functools import lru_cache
+import time
+import asyncio
+from typing import Dict, Any, List, Tuple
 import threading
 
 from app.core.logging_config import get_logger
@@ -20,6 +19,45 @@ from app.core.exceptions import (
     PredictionInputError,
 )
 from app.models import PredictionResponse, ModelPrediction, EnsemblePrediction
+from app.services._model_registry import (
+    FEATURE_COLUMNS,
+    MODEL_BUNDLE_FILENAME,
+    compile_decision_tree,
+    compile_logistic,
+    ensure_shared_importable,
+    evict,
+    get_json,
+    get_model,
+    get_model_bundle,
+)
+
+# Make the shared preprocessor package importable once at import time instead
+# of mutating sys.path on every load
+ensure_shared_importable()
+
+# Micro-batching: concurrent predictions arriving within the window share a
+# single predict_proba call per model instead of one call per request.
+MAX_BATCH_SIZE = 32
+BATCH_WINDOW_SECONDS = 0.002
+
+# Label lookups indexed by threshold comparisons (False/True -> 0/1)
+_PREDICTION_LABELS = ("did_not_survive", "survived")
+_CONFIDENCE_LEVELS = ("low", "medium", "high")
+
+# How long is_healthy reuses a file-existence check or a failed accuracy load
+HEALTH_CACHE_SECONDS = 5.0
+
+# Unload models after this long without a prediction (MODEL_IDLE_SECS, 0
+# disables); idleness is checked at most every IDLE_CHECK_SECONDS
+DEFAULT_MODEL_IDLE_SECONDS = 300.0
+IDLE_CHECK_SECONDS = 60.0
+
+# Reported when evaluation_results.json cannot be read
+_FALLBACK_MODEL_ACCURACY = {
+    "logistic_regression": 0.83,
+    "decision_tree": 0.80,
+    "ensemble": 0.82,
+}
 
 
 class LazyMLService:
@@ -29,7 +67,7 @@ class LazyMLService:
     Key optimizations:
     1. Lazy model loading - models loaded on first use
     2. Thread-safe singleton pattern
-    3. LRU cache for frequently accessed data
+    3. Double-checked locking so loaded components are read lock-free
     4. Minimal startup initialization
     5. Async model loading with caching
     """
@@ -39,8 +77,15 @@ class LazyMLService:
         self.models_dir = models_dir
         self.logger = get_logger("lazy_ml_service")
 
-        # Thread safety for lazy loading
-        self._lock = threading.RLock()
+        # Artifact paths, joined once rather than on every load or health probe
+        self._bundle_path = os.path.join(models_dir, MODEL_BUNDLE_FILENAME)
+        self._lr_path = os.path.join(models_dir, "logistic_model.pkl")
+        self._dt_path = os.path.join(models_dir, "decision_tree_model.pkl")
+        self._label_encoders_path = os.path.join(models_dir, "label_encoders.pkl")
+        self._eval_path = os.path.join(models_dir, "evaluation_results.json")
+
+        # Thread safety for lazy loading (loaders never nest, so no RLock needed)
+        self._lock = threading.Lock()
 
         # Lazy-loaded components (None until first access)
         self._preprocessor = None
@@ -48,12 +93,32 @@ class LazyMLService:
         self._dt_model = None
         self._label_encoders = None
         self._model_accuracy = None
-        self._feature_columns = None
+
+        # (lr_predict, dt_predict) kernels compiled from the fitted models at
+        # load time, swapped as one tuple so readers never see half of a pair
+        self._kernels = None
 
         # Loading state tracking
         self._preprocessor_loaded = False
         self._models_loaded = False
         self._accuracy_loaded = False
+        self._accuracy_retry_at = 0.0
+
+        # Idle eviction: model files in use, last prediction time, check timer
+        self._model_paths: List[str] = []
+        self._last_used = 0.0
+        self._idle_ttl = float(
+            os.getenv("MODEL_IDLE_SECS", str(DEFAULT_MODEL_IDLE_SECONDS))
+        )
+        self._idle_timer = None
+
+        # Health probe caches
+        self._encoders_exist_cache = None  # (checked_at, exists)
+
+        # Pending (features, future) pairs waiting for the next batch flush
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._flush_handle = None
+        self._flush_loop = None  # Loop the flush timer is scheduled on
 
         # Quick validation without loading models
         self._validate_models_dir()
@@ -72,18 +137,16 @@ class LazyMLService:
         # Return True if models directory exists, don't actually load
         return os.path.exists(self.models_dir)
 
-    @lru_cache(maxsize=1)
     def _load_preprocessor(self):
         """Load preprocessor with caching (thread-safe)."""
+        if self._preprocessor_loaded:
+            return self._preprocessor
+
         with self._lock:
             if self._preprocessor_loaded:
                 return self._preprocessor
 
             self.logger.debug("Lazy loading preprocessor")
-            import sys
-            import os
-
-            sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
             from shared.preprocessor import TitanicPreprocessor
 
             try:
@@ -96,9 +159,11 @@ class LazyMLService:
                     details={"models_dir": self.models_dir, "error": str(e)},
                 )
 
-    @lru_cache(maxsize=1)
     def _load_models(self):
         """Load ML models with caching (thread-safe)."""
+        if self._models_loaded:
+            return self._lr_model, self._dt_model, self._label_encoders
+
         with self._lock:
             if self._models_loaded:
                 return self._lr_model, self._dt_model, self._label_encoders
@@ -106,32 +171,31 @@ class LazyMLService:
             self.logger.debug("Lazy loading ML models")
 
             try:
-                # Load models in parallel for faster loading
-                import concurrent.futures
-
-                def load_model(filepath):
-                    with open(filepath, "rb") as f:
-                        return pickle.load(f)  # nosec B301 - internal model files only
-
-                with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-                    # Submit loading tasks
-                    lr_future = executor.submit(
-                        load_model, os.path.join(self.models_dir, "logistic_model.pkl")
-                    )
-                    dt_future = executor.submit(
-                        load_model,
-                        os.path.join(self.models_dir, "decision_tree_model.pkl"),
+                if os.path.exists(self._bundle_path):
+                    bundle = get_model_bundle(self._bundle_path)
+                    self._lr_model = bundle["lr"]
+                    self._dt_model = bundle["dt"]
+                    self._label_encoders = bundle["enc"]
+                    self._model_paths = [self._bundle_path]
+                else:
+                    # Sequential loads: unpickling holds the GIL, so threads
+                    # add startup overhead without any parallelism
+                    self._model_paths = [
+                        self._lr_path,
+                        self._dt_path,
+                        self._label_encoders_path,
+                    ]
+                    self._lr_model, self._dt_model, self._label_encoders = (
+                        get_model(path) for path in self._model_paths
                     )
-                    encoders_future = executor.submit(
-                        load_model, os.path.join(self.models_dir, "label_encoders.pkl")
-                    )
-
-                    # Get results
-                    self._lr_model = lr_future.result(timeout=5)
-                    self._dt_model = dt_future.result(timeout=5)
-                    self._label_encoders = encoders_future.result(timeout=5)
-
+                self._kernels = (
+                    compile_logistic(self._lr_model),
+                    compile_decision_tree(self._dt_model),
+                )
                 self._models_loaded = True
+                # Idle time counts from the load, so warmed-up models are kept
+                self._last_used = time.monotonic()
+                self._schedule_idle_check()
                 self.logger.debug("Models loaded successfully")
                 return self._lr_model, self._dt_model, self._label_encoders
 
@@ -141,17 +205,59 @@ class LazyMLService:
                     details={"models_dir": self.models_dir, "error": str(e)},
                 )
 
-    @lru_cache(maxsize=1)
+    def _schedule_idle_check(self):
+        """Start the timer that unloads models once they go unused (lock held)."""
+        if self._idle_ttl <= 0:
+            return
+
+        timer = threading.Timer(
+            min(self._idle_ttl, IDLE_CHECK_SECONDS), self._evict_if_idle
+        )
+        timer.daemon = True
+        timer.start()
+        self._idle_timer = timer
+
+    def _evict_if_idle(self):
+        """
+        Unload models that have not served a prediction within the idle TTL.
+
+        The next prediction reloads them through the normal lazy path. Entries
+        are also dropped from the shared model registry so memory is released.
+        """
+        with self._lock:
+            self._idle_timer = None
+            if not self._models_loaded:
+                return
+
+            idle_seconds = time.monotonic() - self._last_used
+            if idle_seconds < self._idle_ttl:
+                self._schedule_idle_check()
+                return
+
+            self._models_loaded = False
+            self._kernels = None
+            self._lr_model = self._dt_model = self._label_encoders = None
+            for path in self._model_paths:
+                evict(path)
+            self._model_paths = []
+
+        self.logger.info("Unloaded idle ML models", idle_seconds=round(idle_seconds, 1))
+
     def _load_model_accuracy(self):
         """Load model accuracy with caching."""
+        if self._accuracy_loaded:
+            return self._model_accuracy
+
+        # Don't hit the disk again right after a failed load
+        if time.monotonic() < self._accuracy_retry_at:
+            return dict(_FALLBACK_MODEL_ACCURACY)
+
         with self._lock:
             if self._accuracy_loaded:
                 return self._model_accuracy
 
             try:
-                eval_path = os.path.join(self.models_dir, "evaluation_results.json")
-                with open(eval_path, "r") as f:
-                    eval_results = json.load(f)
+                eval_results = get_json(self._eval_path)
 
                 self._model_accuracy = {
                     "logistic_regression": eval_results["logistic_regression_accuracy"],
@@ -164,11 +270,8 @@ class LazyMLService:
 
             except Exception as e:
                 self.logger.warning(f"Could not load model accuracy: {str(e)}")
-                return {
-                    "logistic_regression": 0.83,
-                    "decision_tree": 0.80,
-                    "ensemble": 0.82,
-                }
+                self._accuracy_retry_at = time.monotonic() + HEALTH_CACHE_SECONDS
+                return dict(_FALLBACK_MODEL_ACCURACY)
 
     @property
     def preprocessor(self):
@@ -181,33 +284,91 @@ class LazyMLService:
         return self._load_model_accuracy()
 
     def get_feature_columns(self) -> list:
-        """Get feature columns (cached)."""
-        if self._feature_columns is None:
-            self._feature_columns = [
-                "pclass",
-                "sex",
-                "age",
-                "sibsp",
-                "parch",
-                "fare",
-                "embarked",
-                "family_size",
-                "is_alone",
-                "age_group",
-            ]
-        return self._feature_columns
+        """Get feature columns."""
+        return list(FEATURE_COLUMNS)
+
+    def _label_encoders_exist(self) -> bool:
+        """Check for the label encoders file, reusing recent results."""
+        now = time.monotonic()
+        cached = self._encoders_exist_cache
+        if cached is not None and now - cached[0] < HEALTH_CACHE_SECONDS:
+            return cached[1]
+
+        exists = os.path.exists(self._label_encoders_path)
+        self._encoders_exist_cache = (now, exists)
+        return exists
 
     def is_healthy(self) -> Dict[str, Any]:
         """Health check without loading models."""
         return {
             "status": "healthy",
             "models_loaded": self.is_loaded,
-            "preprocessor_ready": os.path.exists(
-                os.path.join(self.models_dir, "label_encoders.pkl")
-            ),
+            "preprocessor_ready": self._label_encoders_exist(),
             "model_accuracy": self.model_accuracy,
         }
 
+    def _flush_batch(self, lr_predict, dt_predict):
+        """Run all pending rows through both models and resolve their futures."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        try:
+            if len(batch) == 1:
+                features = batch[0][0]
+            else:
+                import numpy as np
+
+                features = np.concatenate([row for row, _ in batch])
+
+            lr_probs = lr_predict(features)
+            dt_probs = dt_predict(features)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), lr_prob, dt_prob in zip(batch, lr_probs, dt_probs):
+            if not future.done():
+                future.set_result((lr_prob, dt_prob))
+
+    async def _predict_probabilities(self, lr_predict, dt_predict, features):
+        """
+        Queue a preprocessed feature row (a 1 x n array) for batched inference.
+
+        The first row of a batch schedules a flush after BATCH_WINDOW_SECONDS;
+        reaching MAX_BATCH_SIZE flushes immediately.
+
+        Returns:
+            Tuple of (logistic regression, decision tree) survival probabilities
+        """
+        loop = asyncio.get_running_loop()
+        if self._flush_handle is not None and self._flush_loop is not loop:
+            # A timer left by another loop (e.g. a previous asyncio.run that
+            # closed before it fired) will never flush here; its rows belong
+            # to that loop, so drop them and start a fresh batch
+            self._flush_handle.cancel()
+            self._flush_handle = None
+            self._pending = []
+
+        future = loop.create_future()
+        self._pending.append((features, future))
+
+        if len(self._pending) >= MAX_BATCH_SIZE:
+            self._flush_batch(lr_predict, dt_predict)
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(
+                BATCH_WINDOW_SECONDS, self._flush_batch, lr_predict, dt_predict
+            )
+            self._flush_loop = loop
+
+        return await future
+
     async def predict_survival(
         self, passenger_data: Dict[str, Any]
     ) -> PredictionResponse:
@@ -219,48 +380,44 @@ class LazyMLService:
         try:
             # Lazy load components as needed
             preprocessor = self.preprocessor
-            lr_model, dt_model, label_encoders = self._load_models()
+            self._last_used = time.monotonic()
+            kernels = self._kernels
+            if kernels is None:
+                self._load_models()
+                kernels = self._kernels
+            lr_predict, dt_predict = kernels
 
             # Preprocess data
             processed_data = preprocessor.preprocess_single_passenger(passenger_data)
 
-            # Make predictions
-            lr_prob = lr_model.predict_proba(processed_data)[0][1]
-            dt_prob = dt_model.predict_proba(processed_data)[0][1]
-
-            # Calculate ensemble
-            ensemble_prob = (lr_prob + dt_prob) / 2
-
-            # Create response objects
-            lr_prediction = ModelPrediction(
-                probability=float(lr_prob),
-                prediction="survived" if lr_prob > 0.5 else "did_not_survive",
-            )
-
-            dt_prediction = ModelPrediction(
-                probability=float(dt_prob),
-                prediction="survived" if dt_prob > 0.5 else "did_not_survive",
+            # Make predictions (batched with concurrent requests)
+            lr_prob, dt_prob = await self._predict_probabilities(
+                lr_predict, dt_predict, processed_data.to_numpy(dtype=float)
             )
 
-            # Calculate confidence
+            lr_prob, dt_prob = float(lr_prob), float(dt_prob)
+            ensemble_prob = (lr_prob + dt_prob) / 2
             confidence = 1.0 - abs(lr_prob - dt_prob)
-            confidence_level = (
-                "high" if confidence > 0.8 else "medium" if confidence > 0.6 else "low"
-            )
-
-            ensemble_prediction = EnsemblePrediction(
-                probability=float(ensemble_prob),
-                prediction="survived" if ensemble_prob > 0.5 else "did_not_survive",
-                confidence=float(confidence),
-                confidence_level=confidence_level,
-            )
 
-            return PredictionResponse(
+            return PredictionResponse.model_construct(
                 individual_models={
-                    "logistic_regression": lr_prediction,
-                    "decision_tree": dt_prediction,
+                    "logistic_regression": ModelPrediction.model_construct(
+                        probability=lr_prob,
+                        prediction=_PREDICTION_LABELS[lr_prob > 0.5],
+                    ),
+                    "decision_tree": ModelPrediction.model_construct(
+                        probability=dt_prob,
+                        prediction=_PREDICTION_LABELS[dt_prob > 0.5],
+                    ),
                 },
-                ensemble_result=ensemble_prediction,
+                ensemble_result=EnsemblePrediction.model_construct(
+                    probability=ensemble_prob,
+                    prediction=_PREDICTION_LABELS[ensemble_prob > 0.5],
+                    confidence=confidence,
+                    confidence_level=_CONFIDENCE_LEVELS[
+                        (confidence > 0.6) + (confidence > 0.8)
+                    ],
+                ),
             )
 
         except ConfigurationError:
@@ -282,8 +439,20 @@ class LazyMLService:
             )
 
 
-# Global lazy ML service instance
-lazy_ml_service = LazyMLService()
+# Process-wide LazyMLService, created on first use rather than at import so
+# importing this module does no filesystem work
+_lazy_instance = None
+_lazy_instance_lock = threading.Lock()
+
+
+def get_lazy_ml_service() -> LazyMLService:
+    """Get the shared LazyMLService, constructing it on first call."""
+    global _lazy_instance
+    if _lazy_instance is None:
+        with _lazy_instance_lock:
+            if _lazy_instance is None:
+                _lazy_instance = LazyMLService()
+    return _lazy_instance
 
 
 # Compatibility layer for existing code
@@ -294,10 +463,15 @@ class FastMLService:
     This class provides immediate startup with lazy loading of heavy components.
     """
 
-    def __init__(self):
-        self._delegate = lazy_ml_service
+    def __init__(self, delegate_factory=get_lazy_ml_service):
+        self._delegate_factory = delegate_factory
         self.logger = get_logger("fast_ml_service")
 
+    @property
+    def _delegate(self) -> LazyMLService:
+        """Underlying lazy service (constructed on first access)."""
+        return self._delegate_factory()
+
     @property
     def is_loaded(self) -> bool:
         """Quick health check without loading models."""
@@ -305,10 +479,11 @@ class FastMLService:
 
     async def load_models(self):
         """
-        Fast startup - no actual loading, just validation.
+        Fast startup - no blocking load, just validation.
 
         For Firebase Functions, we skip expensive startup loading.
-        Models will be loaded on first use.
+        Models will be loaded on first use, or pre-warmed in a background
+        thread when EAGER_WARMUP=1 (useful with min-instances >= 1).
         """
         self.logger.info("Fast startup mode - models will be lazy loaded")
 
@@ -318,12 +493,32 @@ class FastMLService:
                 f"Models directory not found: {self._delegate.models_dir}"
             )
 
+        eager_warmup = os.getenv("EAGER_WARMUP") == "1"
+        if eager_warmup:
+            threading.Thread(target=self._warmup, name="ml-warmup", daemon=True).start()
+
         self.logger.info(
             "ML service ready for lazy loading",
             startup_mode="fast",
+            eager_warmup=eager_warmup,
             models_dir=self._delegate.models_dir,
         )
 
+    def _warmup(self):
+        """Load models in the background so the first request finds them ready."""
+        try:
+            self._delegate._load_preprocessor()
+            self._delegate._load_models()
+            self._delegate._load_model_accuracy()
+            self.logger.info("Background model warmup completed")
+        except Exception as e:
+            # Requests retry the load on demand and surface the error there
+            self.logger.warning(
+                "Background model warmup failed",
+                error_type=type(e).__name__,
+                error_message=str(e),
+            )
+
     async def predict_survival(
         self, passenger_data: Dict[str, Any]
     ) -> PredictionResponse:
@@ -7,18 +7,22 @@ api_example.py for production use with FastAPI.
 """
 
 import os
-import pickle  # nosec B403 - used only for internal ML model files
-import json
-import sys
+import logging
 from typing import Dict, Any
 
-# Add project root to path for shared imports
-sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
-
-from shared.preprocessor import TitanicPreprocessor
 from app.models import PredictionResponse, ModelPrediction, EnsemblePrediction
 from app.core.exceptions import ModelNotLoadedError, PredictionError, ConfigurationError
 from app.core.logging_config import get_logger
+from app.services._model_registry import (
+    FEATURE_COLUMNS,
+    MODEL_BUNDLE_FILENAME,
+    compile_decision_tree,
+    compile_logistic,
+    ensure_shared_importable,
+    get_json,
+    get_model,
+    get_model_bundle,
+)
 
 
 class MLService:
@@ -35,6 +39,8 @@ class MLService:
         self.preprocessor = None
         self.lr_model = None
         self.dt_model = None
+        self.lr_predict = None
+        self.dt_predict = None
         self.model_accuracy = {}
         self.is_loaded = False
         self.logger = get_logger("ml_service")
@@ -64,6 +70,11 @@ class MLService:
                 },
             )
 
+        # Deferred imports: pandas/sklearn (via the shared preprocessor) are only
+        # pulled in when models are actually loaded, not at module import
+        ensure_shared_importable()
+        from shared.preprocessor import TitanicPreprocessor
+
         try:
             # Load preprocessor
             self.logger.info(
@@ -80,13 +91,19 @@ class MLService:
             # 2. Model files are stored in a controlled environment
             # 3. No external/user-provided pickle files are loaded
             self.logger.info("Loading trained models", initialization_phase="models")
-            with open(os.path.join(self.models_dir, "logistic_model.pkl"), "rb") as f:
-                self.lr_model = pickle.load(f)  # nosec B301 - internal model files only
-
-            with open(
-                os.path.join(self.models_dir, "decision_tree_model.pkl"), "rb"
-            ) as f:
-                self.dt_model = pickle.load(f)  # nosec B301 - internal model files only
+            bundle_path = os.path.join(self.models_dir, MODEL_BUNDLE_FILENAME)
+            if os.path.exists(bundle_path):
+                bundle = get_model_bundle(bundle_path)
+                self.lr_model, self.dt_model = bundle["lr"], bundle["dt"]
+            else:
+                self.lr_model = get_model(
+                    os.path.join(self.models_dir, "logistic_model.pkl")
+                )
+                self.dt_model = get_model(
+                    os.path.join(self.models_dir, "decision_tree_model.pkl")
+                )
+            self.lr_predict = compile_logistic(self.lr_model)
+            self.dt_predict = compile_decision_tree(self.dt_model)
 
             # Load evaluation results for health checks
             eval_results_path = os.path.join(self.models_dir, "evaluation_results.json")
@@ -95,17 +112,14 @@ class MLService:
                     "Loading model evaluation results",
                     initialization_phase="evaluation_results",
                 )
-                with open(eval_results_path, "r") as f:
-                    eval_results = json.load(f)
-                    self.model_accuracy = {
-                        "logistic_regression": eval_results.get(
-                            "logistic_regression_accuracy", 0.0
-                        ),
-                        "decision_tree": eval_results.get(
-                            "decision_tree_accuracy", 0.0
-                        ),
-                        "ensemble": eval_results.get("ensemble_accuracy", 0.0),
-                    }
+                eval_results = get_json(eval_results_path)
+                self.model_accuracy = {
+                    "logistic_regression": eval_results.get(
+                        "logistic_regression_accuracy", 0.0
+                    ),
+                    "decision_tree": eval_results.get("decision_tree_accuracy", 0.0),
+                    "ensemble": eval_results.get("ensemble_accuracy", 0.0),
+                }
             else:
                 self.logger.warning(
                     "Evaluation results file not found",
@@ -172,23 +186,31 @@ class MLService:
                 "Models not loaded. Service initialization failed."
             )
 
+        # Debug payloads are only built when DEBUG output is enabled; loggers of
+        # an unconfigured structlog have no isEnabledFor and emit every level
+        is_enabled_for = getattr(self.logger, "isEnabledFor", None)
+        debug_enabled = is_enabled_for is None or is_enabled_for(logging.DEBUG)
+
         try:
-            self.logger.debug(
-                "Starting prediction process", prediction_phase="preprocessing"
-            )
+            if debug_enabled:
+                self.logger.debug(
+                    "Starting prediction process", prediction_phase="preprocessing"
+                )
 
             # Preprocess passenger data using shared preprocessor
             features = self.preprocessor.preprocess_single_passenger(passenger_data)
 
-            self.logger.debug(
-                "Preprocessing completed",
-                prediction_phase="model_inference",
-                feature_shape=features.shape if hasattr(features, "shape") else None,
-            )
+            if debug_enabled:
+                self.logger.debug(
+                    "Preprocessing completed",
+                    prediction_phase="model_inference",
+                    feature_shape=getattr(features, "shape", None),
+                )
 
             # Get predictions from both models
-            lr_prob = self.lr_model.predict_proba(features)[0, 1]
-            dt_prob = self.dt_model.predict_proba(features)[0, 1]
+            feature_row = features.to_numpy(dtype=float)
+            lr_prob = float(self.lr_predict(feature_row)[0])
+            dt_prob = self.dt_predict(feature_row)[0]
 
             # Ensemble prediction (average)
             ensemble_prob = (lr_prob + dt_prob) / 2
@@ -204,37 +226,36 @@ class MLService:
             else:
                 confidence_level = "low"
 
-            self.logger.debug(
-                "Model inference completed",
-                prediction_phase="result_formatting",
-                logistic_regression_prob=round(lr_prob, 3),
-                decision_tree_prob=round(dt_prob, 3),
-                ensemble_prob=round(ensemble_prob, 3),
-                confidence=round(confidence, 3),
-                confidence_level=confidence_level,
-            )
+            if debug_enabled:
+                self.logger.debug(
+                    "Model inference completed",
+                    prediction_phase="result_formatting",
+                    logistic_regression_prob=round(lr_prob, 3),
+                    decision_tree_prob=round(dt_prob, 3),
+                    ensemble_prob=round(ensemble_prob, 3),
+                    confidence=round(confidence, 3),
+                    confidence_level=confidence_level,
+                )
 
-            # Create individual model predictions
             individual_models = {
-                "logistic_regression": ModelPrediction(
-                    probability=round(lr_prob, 3),
+                "logistic_regression": ModelPrediction.model_construct(
+                    probability=lr_prob,
                     prediction="survived" if lr_prob >= 0.5 else "did_not_survive",
                 ),
-                "decision_tree": ModelPrediction(
-                    probability=round(dt_prob, 3),
+                "decision_tree": ModelPrediction.model_construct(
+                    probability=dt_prob,
                     prediction="survived" if dt_prob >= 0.5 else "did_not_survive",
                 ),
             }
 
-            # Create ensemble prediction
-            ensemble_result = EnsemblePrediction(
-                probability=round(ensemble_prob, 3),
+            ensemble_result = EnsemblePrediction.model_construct(
+                probability=ensemble_prob,
                 prediction="survived" if ensemble_prob >= 0.5 else "did_not_survive",
-                confidence=round(confidence, 3),
+                confidence=confidence,
                 confidence_level=confidence_level,
             )
 
-            return PredictionResponse(
+            return PredictionResponse.model_construct(
                 individual_models=individual_models, ensemble_result=ensemble_result
             )
 
@@ -261,10 +282,18 @@ class MLService:
             List of feature column names
         """
         if not self.is_loaded or not self.preprocessor:
-            return []
+            return list(FEATURE_COLUMNS)
 
         return self.preprocessor.get_feature_columns()
 
 
-# Global ML service instance (initialized at startup)
-ml_service = MLService()
+# Process-wide ML service, created on first use rather than at import
+_ml_service = None
+
+
+def get_ml_service() -> MLService:
+    """Get the shared MLService, constructing it on first call."""
+    global _ml_service
+    if _ml_service is None:
+        _ml_service = MLService()
+    return _ml_service
@@ -7,7 +7,6 @@ security vulnerabilities.
 """
 
 import re
-import html
 import unicodedata
 from typing import Dict, Any, List, Union
 
@@ -16,6 +15,114 @@ from app.core.logging_config import get_logger
 
 logger = get_logger("validation")
 
+# str.translate table deleting the C0/C1 control characters rejected in input
+# (tab, newline and carriage return are allowed)
+_CONTROL_CHAR_DELETIONS = dict.fromkeys(
+    [*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), *range(0x7F, 0xA0)]
+)
+
+# Reasonable upper bound on sanitized string length
+MAX_STRING_LENGTH = 100
+
+# Realistic bounds for the Titanic dataset: field -> (min, max, typical_max)
+_NUMERIC_BOUNDS = {
+    "age": (0, 120, 80),
+    "fare": (0, 1000, 500),
+    "sibsp": (0, 20, 8),  # Historical max was 8
+    "parch": (0, 20, 9),  # Historical max was 9
+}
+
+# Valid categorical values
+_SEX_SET = frozenset(("male", "female"))
+_EMB_SET = frozenset("CQS")
+_PCLASS_SET = frozenset((1, 2, 3))
+
+# _check_bounds results
+_IN_RANGE, _OUT_OF_RANGE, _OUTLIER = 0, 1, 2
+
+
+def _check_bounds(value, minimum, maximum, typical_max) -> int:
+    """Classify a numeric value against its bounds with plain comparisons."""
+    if value < minimum or value > maximum:
+        return _OUT_OF_RANGE
+    if value > typical_max:
+        return _OUTLIER
+    return _IN_RANGE
+
+
+def _invalid_category(field_name: str, value: Any, valid_values) -> ValidationError:
+    """Build the error raised for a value outside its field's categories."""
+    return ValidationError(
+        message=f"Field '{field_name}' has invalid value",
+        details={
+            "field": field_name,
+            "value": value,
+            "valid_values": list(valid_values),
+        },
+    )
+
+
+# Anomaly names by bit position in the _anomaly_mask result
+_ANOMALY_NAMES = (
+    "child_high_fare",
+    "large_family_size",
+    "first_class_low_fare",
+    "third_class_high_fare",
+)
+
+
+def _anomaly_mask(age, fare, sibsp, parch, pclass) -> int:
+    """Rough consistency heuristics, packed one bit per _ANOMALY_NAMES entry."""
+    mask = 0
+
+    # Check age vs fare relationship (very rough heuristic)
+    if age < 12 and fare > 100:
+        mask |= 1
+
+    # Check family size consistency
+    if sibsp + parch + 1 > 10:
+        mask |= 2
+
+    # Very rough fare expectations by class
+    if pclass == 1 and fare < 20:
+        mask |= 4
+    elif pclass == 3 and fare > 100:
+        mask |= 8
+
+    return mask
+
+
+def _anomaly_names(mask: int) -> List[str]:
+    """Expand an anomaly bitmask into its anomaly names."""
+    return [name for bit, name in enumerate(_ANOMALY_NAMES) if mask >> bit & 1]
+
+
+# SQL injection and XSS fused into one alternation so clean input is scanned
+# once; the named group that matched identifies the rejection reason
+_REJECT_RE = re.compile(
+    r"(?P<sqli>\b(?:union|select|insert|update|delete|drop|create|alter|exec|execute)\b|"
+    r'[\'";]|--|\*|/\*|\*/)|'
+    r"(?P<xss><script|<iframe|<object|<embed|javascript:|vbscript:|on\w+\s*=)",
+    # Unicode classes: the scan runs before NFKC, so \s must also catch
+    # non-ASCII whitespace such as NBSP that normalization turns into a space
+    re.IGNORECASE,
+)
+
+_WS_RE = re.compile(r"\s{10,}")  # 10+ consecutive whitespace characters
+
+# Joins query parameter values for a single rejection scan; it is not a word
+# or whitespace character, so no pattern can match across two values
+_QUERY_VALUE_SEPARATOR = "\x01"
+
+# Fused rejection pattern group -> (log event, issue)
+_REJECTION_REASONS = {
+    "sqli": (
+        "SQL injection attempt detected",
+        "invalid_characters",
+    ),
+    "xss": ("XSS attempt detected", "invalid_characters"),
+}
+
 
 class InputSanitizer:
     """
@@ -32,34 +139,29 @@ class InputSanitizer:
     """
 
     def __init__(self):
-        # Precompiled regex patterns for efficiency
-        self.patterns = {
-            "sql_injection": re.compile(
-                r"(\b(union|select|insert|update|delete|drop|create|alter|exec|execute)\b|"
-                r'[\'";]|--|\*|/\*|\*/)',
-                re.IGNORECASE,
-            ),
-            "xss_patterns": re.compile(
-                r"(<script|<iframe|<object|<embed|javascript:|vbscript:|on\w+\s*=)",
-                re.IGNORECASE,
-            ),
-            "suspicious_chars": re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]"),
-            "excessive_whitespace": re.compile(r"\s{10,}"),  # 10+ consecutive spaces
-        }
-
-        # Define realistic bounds for Titanic dataset
+        # Define realistic bounds for Titanic dataset; validation reads the
+        # tuples in _NUMERIC_BOUNDS, this mapping is informational
         self.bounds = {
-            "age": {"min": 0, "max": 120, "typical_max": 80},
-            "fare": {"min": 0, "max": 1000, "typical_max": 500},
-            "sibsp": {"min": 0, "max": 20, "typical_max": 8},  # Historical max was 8
-            "parch": {"min": 0, "max": 20, "typical_max": 9},  # Historical max was 9
+            field: {"min": minimum, "max": maximum, "typical_max": typical_max}
+            for field, (minimum, maximum, typical_max) in _NUMERIC_BOUNDS.items()
         }
 
         # Valid categorical values
         self.valid_categories = {
-            "sex": {"male", "female"},
-            "embarked": {"C", "Q", "S"},
-            "pclass": {1, 2, 3},
+            "sex": _SEX_SET,
+            "embarked": _EMB_SET,
+            "pclass": _PCLASS_SET,
+        }
+
+        # Per-field validation handlers; fields without one are dropped
+        self._handlers = {
+            "sex": self._handle_sex,
+            "embarked": self._handle_embarked,
+            "pclass": self._handle_pclass,
+            "age": self._handle_float_bounds,
+            "fare": self._handle_float_bounds,
+            "sibsp": self._handle_int_bounds,
+            "parch": self._handle_int_bounds,
         }
 
     def sanitize_string(self, value: str, field_name: str) -> str:
@@ -84,8 +186,9 @@ class InputSanitizer:
 
         original_value = value
 
-        # 1. Remove null bytes and control characters
-        if self.patterns["suspicious_chars"].search(value):
+        # 1. Reject null bytes and control characters (translate deletes them
+        # in a single C loop, so a length change means one was present)
+        if len(value.translate(_CONTROL_CHAR_DELETIONS)) != len(value):
             logger.warning(
                 "Suspicious characters detected in input",
                 field=field_name,
@@ -96,44 +199,39 @@ class InputSanitizer:
                 details={"field": field_name, "issue": "control_characters"},
             )
 
-        # 2. Check for SQL injection patterns
-        if self.patterns["sql_injection"].search(value):
-            logger.warning(
-                "SQL injection attempt detected", field=field_name, pattern_matched=True
-            )
-            raise ValidationError(
-                message=f"Field '{field_name}' contains invalid content",
-                details={"field": field_name, "issue": "invalid_characters"},
-            )
-
-        # 3. Check for XSS patterns
-        if self.patterns["xss_patterns"].search(value):
-            logger.warning(
-                "XSS attempt detected", field=field_name, pattern_matched=True
-            )
+        # 2-3. Check for SQL injection and XSS patterns
+        match = _REJECT_RE.search(value)
+        if match:
+            event, issue = _REJECTION_REASONS[match.lastgroup]
+            logger.warning(event, field=field_name, pattern_matched=True)
             raise ValidationError(
                 message=f"Field '{field_name}' contains invalid content",
-                details={"field": field_name, "issue": "invalid_characters"},
+                details={"field": field_name, "issue": issue},
             )
 
-        # 4. Normalize Unicode
-        value = unicodedata.normalize("NFKC", value)
+        # 4. Normalize Unicode (a no-op for pure ASCII, which isascii checks
+        # in constant time)
+        if not value.isascii():
+            value = unicodedata.normalize("NFKC", value)
 
-        # 5. HTML escape for safety
-        value = html.escape(value)
+        # Values feed the model, never an HTML page, so they are not
+        # HTML-escaped (escaping would only alter legitimate characters)
 
-        # 6. Strip excessive whitespace but preserve single spaces
-        value = self.patterns["excessive_whitespace"].sub(" ", value)
+        # 5. Strip excessive whitespace but preserve single spaces. A run of
+        # 10+ whitespace is either all ASCII spaces or contains a character
+        # isprintable rejects, so most values skip the regex entirely
         value = value.strip()
+        if "  " in value or not value.isprintable():
+            value = _WS_RE.sub(" ", value)
 
-        # 7. Check length bounds
+        # 6. Check length bounds
         if len(value) == 0:
             raise ValidationError(
                 message=f"Field '{field_name}' cannot be empty after sanitization",
                 details={"field": field_name, "issue": "empty_after_sanitization"},
             )
 
-        if len(value) > 100:  # Reasonable upper bound
+        if len(value) > MAX_STRING_LENGTH:
             logger.warning(
                 "Unusually long string input",
                 field=field_name,
@@ -144,7 +242,7 @@ class InputSanitizer:
                 message=f"Field '{field_name}' is too long",
                 details={
                     "field": field_name,
-                    "max_length": 100,
+                    "max_length": MAX_STRING_LENGTH,
                     "actual_length": len(value),
                 },
             )
@@ -167,32 +265,36 @@ class InputSanitizer:
         Raises:
             ValidationError: If value is out of bounds or suspicious
         """
-        if field_name not in self.bounds:
+        bounds = _NUMERIC_BOUNDS.get(field_name)
+        if bounds is None:
             return value  # No specific bounds defined
 
-        bounds = self.bounds[field_name]
+        status = _check_bounds(value, *bounds)
+        if status == _IN_RANGE:
+            return value
+
+        minimum, maximum, typical_max = bounds
 
         # Check hard bounds
-        if value < bounds["min"] or value > bounds["max"]:
+        if status == _OUT_OF_RANGE:
             raise ValidationError(
                 message=f"Field '{field_name}' is out of valid range",
                 details={
                     "field": field_name,
                     "value": value,
-                    "min": bounds["min"],
-                    "max": bounds["max"],
+                    "min": minimum,
+                    "max": maximum,
                 },
             )
 
-        # Check for suspicious values (outliers)
-        if value > bounds.get("typical_max", bounds["max"]):
-            logger.info(
-                "Unusual value detected",
-                field=field_name,
-                value=value,
-                typical_max=bounds["typical_max"],
-                severity="outlier",
-            )
+        # Suspicious but valid values (outliers)
+        logger.info(
+            "Unusual value detected",
+            field=field_name,
+            value=value,
+            typical_max=typical_max,
+            severity="outlier",
+        )
 
         return value
 
@@ -216,14 +318,7 @@ class InputSanitizer:
         valid_values = self.valid_categories[field_name]
 
         if value not in valid_values:
-            raise ValidationError(
-                message=f"Field '{field_name}' has invalid value",
-                details={
-                    "field": field_name,
-                    "value": value,
-                    "valid_values": list(valid_values),
-                },
-            )
+            raise _invalid_category(field_name, value, valid_values)
 
         return value
 
@@ -237,39 +332,86 @@ class InputSanitizer:
         Returns:
             List of anomaly descriptions
         """
-        anomalies = []
-
-        # Check for logical inconsistencies
-        if passenger_data.get("age", 0) < 16 and passenger_data.get("parch", 0) > 0:
-            # Child with parents/children - could be valid but worth noting
-            pass
+        return _anomaly_names(self._anomaly_mask(passenger_data))
+
+    @staticmethod
+    def _anomaly_mask(passenger_data: Dict[str, Any]) -> int:
+        """Anomaly bitmask for passenger data, defaulting missing fields."""
+        get = passenger_data.get
+        return _anomaly_mask(
+            get("age", 0),
+            get("fare", 0),
+            get("sibsp", 0),
+            get("parch", 0),
+            get("pclass", 3),
+        )
+
+    @staticmethod
+    def _coerce_int(value: Any, field_name: str) -> int:
+        """Coerce an integer field, accepting numeric strings such as "2.0"."""
+        if isinstance(value, int):
+            return value
+        try:
+            # Plain digit strings convert directly, without a temporary float
+            if isinstance(value, str) and value.isdecimal():
+                return int(value)
+            return int(float(value))  # Handle "2.0" -> 2
+        except (ValueError, TypeError, OverflowError):
+            raise ValidationError(
+                message=f"Field '{field_name}' must be an integer",
+                details={"field": field_name, "value": value},
+            )
 
-        # Check age vs fare relationship (very rough heuristic)
-        age = passenger_data.get("age", 0)
-        fare = passenger_data.get("fare", 0)
+    @staticmethod
+    def _coerce_float(value: Any, field_name: str) -> Union[int, float]:
+        """Coerce a numeric field, leaving ints and floats untouched."""
+        if isinstance(value, (int, float)):
+            return value
+        try:
+            return float(value)
+        except (ValueError, TypeError):
+            raise ValidationError(
+                message=f"Field '{field_name}' must be numeric",
+                details={"field": field_name, "value": value},
+            )
 
-        if age < 12 and fare > 100:
-            anomalies.append("child_high_fare")
+    # Categorical handlers only need to normalize and check membership
+    # against the module frozensets: anything outside the set is rejected, so
+    # the free-text sanitization pass would be redundant for these fields.
+    # validate_categorical stays as the public equivalent.
 
-        # Check family size consistency
-        sibsp = passenger_data.get("sibsp", 0)
-        parch = passenger_data.get("parch", 0)
-        family_size = sibsp + parch + 1
+    def _handle_sex(self, value: Any, field_name: str) -> str:
+        """Normalize the sex field and check its category."""
+        value = str(value).lower().strip()
+        if value not in _SEX_SET:
+            raise _invalid_category(field_name, value, _SEX_SET)
+        return value
 
-        if family_size > 10:
-            anomalies.append("large_family_size")
+    def _handle_embarked(self, value: Any, field_name: str) -> str:
+        """Normalize the embarked field and check its category."""
+        value = str(value).upper().strip()
+        if value not in _EMB_SET:
+            raise _invalid_category(field_name, value, _EMB_SET)
+        return value
 
-        # Check fare vs class consistency
-        pclass = passenger_data.get("pclass", 3)
-        fare = passenger_data.get("fare", 0)
+    def _handle_pclass(self, value: Any, field_name: str) -> int:
+        """Coerce the pclass field and check its category."""
+        value = self._coerce_int(value, field_name)
+        if value not in _PCLASS_SET:
+            raise _invalid_category(field_name, value, _PCLASS_SET)
+        return value
 
-        # Very rough fare expectations by class
-        if pclass == 1 and fare < 20:
-            anomalies.append("first_class_low_fare")
-        elif pclass == 3 and fare > 100:
-            anomalies.append("third_class_high_fare")
+    def _handle_float_bounds(self, value: Any, field_name: str) -> Union[int, float]:
+        """Coerce a numeric field and check its bounds."""
+        return self.validate_numeric_bounds(
+            self._coerce_float(value, field_name), field_name
+        )
 
-        return anomalies
+    def _handle_int_bounds(self, value: Any, field_name: str) -> int:
+        """Coerce an integer field and check its bounds."""
+        return self.validate_numeric_bounds(
+            self._coerce_int(value, field_name), field_name
+        )
 
     def sanitize_and_validate(self, passenger_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -285,105 +427,42 @@ class InputSanitizer:
             ValidationError: If validation fails
         """
         sanitized_data = {}
-
-        try:
-            # Sanitize string fields
-            for field in ["sex", "embarked"]:
-                if field in passenger_data:
-                    sanitized_value = self.sanitize_string(
-                        str(passenger_data[field]), field
-                    )
-                    sanitized_data[field] = sanitized_value
-
-            # Validate and sanitize numeric fields
-            numeric_fields = ["pclass", "age", "sibsp", "parch", "fare"]
-            for field in numeric_fields:
-                if field in passenger_data:
-                    value = passenger_data[field]
-
-                    # Ensure numeric type
-                    if field == "pclass" or field in ["sibsp", "parch"]:
-                        # Integer fields
-                        if not isinstance(value, int):
-                            try:
-                                value = int(float(value))  # Handle "2.0" -> 2
-                            except (ValueError, TypeError):
-                                raise ValidationError(
-                                    message=f"Field '{field}' must be an integer",
-                                    details={"field": field, "value": value},
-                                )
-                    else:
-                        # Float fields
-                        if not isinstance(value, (int, float)):
-                            try:
-                                value = float(value)
-                            except (ValueError, TypeError):
-                                raise ValidationError(
-                                    message=f"Field '{field}' must be numeric",
-                                    details={"field": field, "value": value},
-                                )
-
-                    # Validate bounds
-                    validated_value = self.validate_numeric_bounds(value, field)
-                    sanitized_data[field] = validated_value
-
-            # Validate categorical fields
-            for field in ["sex", "embarked", "pclass"]:
-                if field in sanitized_data:
-                    sanitized_data[field] = self.validate_categorical(
-                        sanitized_data[field], field
-                    )
-
-            # Detect and log anomalies
-            anomalies = self.detect_anomalies(sanitized_data)
-            if anomalies:
-                logger.info(
-                    "Data anomalies detected",
-                    anomalies=anomalies,
-                    passenger_data=sanitized_data,
-                    severity="info",
-                )
-
-            logger.debug(
-                "Input validation completed successfully",
-                fields_validated=len(sanitized_data),
-                anomalies_detected=len(anomalies),
+        handlers = self._handlers
+
+        # Single pass: each known field is coerced, sanitized and
+        # range/category checked by its handler
+        for field, value in passenger_data.items():
+            handler = handlers.get(field)
+            if handler is not None:
+                sanitized_data[field] = handler(value, field)
+
+        # Detect and log anomalies; names are only built when there are any
+        anomaly_mask = self._anomaly_mask(sanitized_data)
+        if anomaly_mask:
+            logger.info(
+                "Data anomalies detected",
+                anomalies=_anomaly_names(anomaly_mask),
+                passenger_data=sanitized_data,
+                severity="info",
             )
 
-            return sanitized_data
+        logger.debug(
+            "Input validation completed successfully",
+            fields_validated=len(sanitized_data),
+            anomalies_detected=anomaly_mask.bit_count(),
+        )
 
-        except ValidationError:
-            # Re-raise validation errors
-            raise
-        except Exception as e:
-            logger.error(
-                "Unexpected error during validation",
-                error_type=type(e).__name__,
-                error_message=str(e),
-            )
-            raise ValidationError(
-                message="Input validation failed", details={"error": str(e)}
-            )
+        return sanitized_data
 
 
 # Global sanitizer instance
 input_sanitizer = InputSanitizer()
 
 
-def validate_passenger_input(passenger_data: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    Main validation function for passenger data.
-
-    Args:
-        passenger_data: Raw passenger data from API request
-
-    Returns:
-        Sanitized and validated passenger data
-
-    Raises:
-        ValidationError: If validation fails
-    """
-    return input_sanitizer.sanitize_and_validate(passenger_data)
+# Main validation entry point for passenger data from API requests, bound once
+# so callers skip the instance attribute lookup (raises ValidationError)
+validate_passenger_input = input_sanitizer.sanitize_and_validate
+_sanitize = input_sanitizer.sanitize_string
 
 
 def validate_query_parameters(params: Dict[str, Any]) -> Dict[str, Any]:
@@ -399,13 +478,27 @@ def validate_query_parameters(params: Dict[str, Any]) -> Dict[str, Any]:
     Raises:
         ValidationError: If validation fails
     """
+    strings = [value for value in params.values() if isinstance(value, str)]
+    clean = not _REJECT_RE.search(_QUERY_VALUE_SEPARATOR.join(strings))
+
     validated_params = {}
 
     for key, value in params.items():
         if isinstance(value, str):
-            # Basic sanitization for query params
-            sanitized_value = input_sanitizer.sanitize_string(value, key)
-            validated_params[key] = sanitized_value
+            stripped = value.strip()
+            # With no rejection match anywhere, a printable ASCII value without
+            # a whitespace run needs no further work beyond the strip; anything
+            # else goes through the full sanitization pipeline
+            if (
+                clean
+                and 0 < len(stripped) <= MAX_STRING_LENGTH
+                and value.isascii()
+                and value.isprintable()
+                and " " * 10 not in stripped
+            ):
+                validated_params[key] = stripped
+            else:
+                validated_params[key] = _sanitize(value, key)
         else:
             validated_params[key] = value
 
@@ -10,12 +10,14 @@ This service is optimized for Cloud Run deployment with:
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
+from starlette.datastructures import Headers, MutableHeaders
 from contextlib import asynccontextmanager
+import json
+import logging
 import time
 import sys
 import os
-import uuid
 
 # Add project root to Python path
 sys.path.append(os.path.dirname(__file__))
@@ -24,19 +26,20 @@ sys.path.append(os.path.dirname(__file__))
 from app.core import (
     config_manager,
     setup_structured_logging,
+    start_log_queue,
+    stop_log_queue,
     get_logger,
     MLServiceError,
 )
 
-# Import services
-from app.services.lazy_ml_service import fast_ml_service as ml_service
-
-# Import API routes
-from app.api.routes import health_router, predictions_router, models_router
+# ML service and API routes are imported during lifespan startup, which mounts
+# the routers before uvicorn serves any request
 
 # Global variables
 app_config = None
 logger = None
+# Whether INFO log lines are emitted, fixed once logging is configured
+_info_enabled = True
 
 
 # Production optimized lifespan
@@ -50,18 +53,23 @@ async def production_lifespan(app: FastAPI):
     - Minimal validation only
     - Fast configuration loading
     - No health checks at startup
+    - Routers (and the ML service) imported here rather than at module import
     """
-    startup_start = time.time()
+    startup_start_ns = time.perf_counter_ns()
 
     try:
         logger.info(
             "Starting Titanic ML Prediction API", startup_phase="initialization"
         )
 
+        from app.services.lazy_ml_service import fast_ml_service as ml_service
+
+        include_routers(app)
+
         # Fast ML service initialization (no model loading)
         await ml_service.load_models()  # Just validates directory
 
-        startup_time = (time.time() - startup_start) * 1000
+        startup_time = (time.perf_counter_ns() - startup_start_ns) / 1e6
         logger.info(
             "ML service initialized successfully",
             startup_phase="completed",
@@ -70,7 +78,7 @@ async def production_lifespan(app: FastAPI):
         )
 
     except Exception as e:
-        startup_time = (time.time() - startup_start) * 1000
+        startup_time = (time.perf_counter_ns() - startup_start_ns) / 1e6
         logger.error(
             "Service startup failed",
             startup_phase="failed",
@@ -80,15 +88,32 @@ async def production_lifespan(app: FastAPI):
         )
         raise
 
-    yield
+    try:
+        yield
+    finally:
+        # Minimal cleanup
+        logger.info("Shutting down Titanic ML Prediction API", shutdown_phase="cleanup")
+        # Later records go straight to stdout again, including those of a
+        # second lifespan in the same process
+        stop_log_queue()
+
 
-    # Minimal cleanup
-    logger.info("Shutting down Titanic ML Prediction API", shutdown_phase="cleanup")
+def include_routers(app: FastAPI):
+    """Import the API routers and mount them on the app, once."""
+    if getattr(app.state, "routers_included", False):
+        return
+
+    from app.api.routes import health_router, predictions_router, models_router
+
+    app.include_router(health_router)
+    app.include_router(predictions_router)
+    app.include_router(models_router)
+    app.state.routers_included = True
 
 
 def load_app_config():
     """Fast configuration loading optimized for startup performance."""
-    global app_config, logger
+    global app_config, logger, _info_enabled
 
     # Load configuration (cached after first load)
     app_config = config_manager.load_config()
@@ -97,8 +122,12 @@ def load_app_config():
     setup_structured_logging(
         environment=app_config.environment, log_level=app_config.logging.level.upper()
     )
+    # Keeps the running listener on a second create_app(), also when this
+    # file runs as __main__ and uvicorn then imports it again as main
+    start_log_queue()
 
     logger = get_logger("main")
+    _info_enabled = logger.isEnabledFor(logging.INFO)
 
     logger.info(
         "Application configuration loaded",
@@ -108,14 +137,8 @@ def load_app_config():
     )
 
 
-# Load configuration immediately
-load_app_config()
-
-# Initialize FastAPI app with optimized lifespan and comprehensive OpenAPI documentation
-app = FastAPI(
-    lifespan=production_lifespan,
-    title="Titanic ML Prediction API",
-    description="""
+# OpenAPI description, only attached when the docs are served
+_DESCRIPTION = """
     ## Machine Learning API for Titanic Passenger Survival Prediction
     
     This production-ready API provides ML-powered predictions for Titanic passenger survival
@@ -150,90 +173,152 @@ app = FastAPI(
     - **500**: Internal server errors
     
     For detailed integration examples and troubleshooting, see the project README.
-    """,
-    version="2.1.0",
-    docs_url="/docs",
-    redoc_url="/redoc",
-    openapi_tags=[
-        {"name": "Root", "description": "Service information and basic endpoints"},
-        {
-            "name": "Health",
-            "description": "Health check endpoints for monitoring service status",
-        },
-        {
-            "name": "Predictions",
-            "description": "ML prediction endpoints (authentication required)",
-        },
-        {
-            "name": "Models",
-            "description": "Model information endpoints (authentication required)",
-        },
-    ],
-)
+    """
 
-# Minimal middleware setup
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=app_config.api.cors_origins,
-    allow_credentials=True,
-    allow_methods=["GET", "POST"],
-    allow_headers=["*"],
-)
+# The root response is static, so clients and proxies may cache it briefly
+_ROOT_HEADERS = {"cache-control": "public, max-age=60"}
 
+# Request tracking and CORS in a single middleware layer
+_urandom = os.urandom
 
-# Lightweight request tracking
-@app.middleware("http")
-async def lightweight_middleware(request: Request, call_next):
-    """Lightweight middleware for Firebase Functions."""
-    start_time = time.time()
-    request_id = str(uuid.uuid4())[:8]  # Shorter ID for Firebase
-    request.state.request_id = request_id
 
-    response = await call_next(request)
+class EdgeMiddleware(CORSMiddleware):
+    """
+    Lightweight request tracking plus CORS for Firebase Functions.
 
-    # Minimal logging
-    process_time = (time.time() - start_time) * 1000
-    if process_time > 100:  # Only log slow requests
-        logger.info(
-            "Request completed",
-            request_id=request_id,
-            endpoint=str(request.url.path),
-            duration_ms=round(process_time, 2),
-        )
+    Implemented as plain ASGI rather than with @app.middleware("http"), which
+    runs each request through BaseHTTPMiddleware's task group and
+    request/response wrappers. CORS handling reuses CORSMiddleware's logic but
+    runs in the same layer, so each request makes one middleware hop.
+    """
 
-    response.headers["X-Request-ID"] = request_id
-    return response
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_ns = time.perf_counter_ns()
+        request_id = _urandom(4).hex()  # Short 8-char ID for Firebase
+        # Request.state reads from scope["state"]
+        scope.setdefault("state", {})["request_id"] = request_id
+
+        async def send_with_request_id(message):
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("X-Request-ID", request_id)
+            elif message["type"] == "http.response.body" and not message.get(
+                "more_body", False
+            ):
+                # Minimal logging
+                process_ns = time.perf_counter_ns() - start_ns
+                # Only log slow requests (>100ms), and only if INFO is emitted
+                if process_ns > 100_000_000 and _info_enabled:
+                    logger.info(
+                        "Request completed",
+                        request_id=request_id,
+                        endpoint=scope["path"],
+                        duration_ms=round(process_ns / 1e6, 2),
+                    )
+            await send(message)
+
+        headers = Headers(scope=scope)
+        if "origin" not in headers:
+            await self.app(scope, receive, send_with_request_id)
+        elif (
+            scope["method"] == "OPTIONS" and "access-control-request-method" in headers
+        ):
+            response = self.preflight_response(request_headers=headers)
+            await response(scope, receive, send_with_request_id)
+        else:
+            await self.simple_response(
+                scope, receive, send_with_request_id, request_headers=headers
+            )
 
 
 # Exception handlers (essential only)
-@app.exception_handler(MLServiceError)
 async def ml_service_exception_handler(request: Request, exc: MLServiceError):
     """Handle ML service exceptions."""
-    request_id = getattr(request.state, "request_id", None)
+    request_id = request.scope.get("state", {}).get("request_id")
     return JSONResponse(
         status_code=exc.status_code, content=exc.to_error_detail(request_id).dict()
     )
 
 
-# Root endpoint (not in a router for fast access)
-@app.get("/", tags=["Root"])
-async def root():
-    """Fast root endpoint."""
-    return {
-        "service": "Titanic ML Prediction API",
-        "version": "2.1.0",
-        "status": "running",
-        "startup_mode": "optimized",
-        "authentication": "JWT Bearer token required for predictions",
-        "docs": "/docs",
-        "health": "/health",
-    }
+def create_app() -> FastAPI:
+    """Load configuration and build the FastAPI application."""
+    load_app_config()
+
+    # Docs default to off in production, skipping their routes and schema build
+    docs_enabled = app_config.api.docs_enabled
+    if docs_enabled is None:
+        docs_enabled = app_config.environment != "production"
+
+    # Initialize FastAPI app with optimized lifespan and comprehensive OpenAPI documentation
+    app = FastAPI(
+        lifespan=production_lifespan,
+        title="Titanic ML Prediction API",
+        description=_DESCRIPTION if docs_enabled else "",
+        version="2.1.0",
+        docs_url="/docs" if docs_enabled else None,
+        redoc_url="/redoc" if docs_enabled else None,
+        openapi_url="/openapi.json" if docs_enabled else None,
+        openapi_tags=[
+            {"name": "Root", "description": "Service information and basic endpoints"},
+            {
+                "name": "Health",
+                "description": "Health check endpoints for monitoring service status",
+            },
+            {
+                "name": "Predictions",
+                "description": "ML prediction endpoints (authentication required)",
+            },
+            {
+                "name": "Models",
+                "description": "Model information endpoints (authentication required)",
+            },
+        ],
+    )
+
+    app.add_middleware(
+        EdgeMiddleware,
+        allow_origins=frozenset(app_config.api.cors_origins),
+        allow_credentials=True,
+        allow_methods=["GET", "POST"],
+        allow_headers=["*"],
+    )
+
+    app.add_exception_handler(MLServiceError, ml_service_exception_handler)
+
+    # Root endpoint (not in a router for fast access); its body never changes,
+    # so it is serialized once here instead of on every request
+    root_body = json.dumps(
+        {
+            "service": "Titanic ML Prediction API",
+            "version": "2.1.0",
+            "status": "running",
+            "startup_mode": "optimized",
+            "authentication": "JWT Bearer token required for predictions",
+            "docs": app.docs_url,
+            "health": "/health",
+        },
+        separators=(",", ":"),
+    ).encode()
+
+    @app.get("/", tags=["Root"])
+    async def root():
+        """Fast root endpoint."""
+        return Response(
+            content=root_body,
+            media_type="application/json",
+            headers=_ROOT_HEADERS,
+        )
+
+    # Routers are included by production_lifespan at startup
+    return app
 
 
-# Include routers
-app.include_router(health_router)
-app.include_router(predictions_router)
-app.include_router(models_router)
+# Module-level app for "main:app"; the test suite builds its own via create_app()
+if os.getenv("PYTEST_FAST_IMPORT") != "1":
+    app = create_app()
 
 
 if __name__ == "__main__":
@@ -266,7 +351,23 @@ if __name__ == "__main__":
     # Enable reload for local development, disable for containerized deployments
     reload_enabled = ml_env == "development" and not os.getenv("PORT")
 
+    # Worker processes (uvicorn rejects several workers together with reload)
+    workers = 1 if reload_enabled else int(os.getenv("WEB_CONCURRENCY", "1"))
+
+    # C event loop and HTTP parser from uvicorn[standard], when installed
+    from importlib.util import find_spec
+
+    loop = "uvloop" if find_spec("uvloop") else "asyncio"
+    http = "httptools" if find_spec("httptools") else "h11"
+
     print("🚀 Starting optimized Titanic ML API...")
     uvicorn.run(
-        "main:app", host=host, port=port, reload=reload_enabled, log_level="info"
+        "main:app",
+        host=host,
+        port=port,
+        reload=reload_enabled,
+        workers=workers,
+        loop=loop,
+        http=http,
+        log_level="info",
     )
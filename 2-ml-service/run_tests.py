@@ -6,11 +6,26 @@ Provides convenient commands for running different types of tests
 with appropriate configuration and reporting.
 """
 
+import importlib.util
 import subprocess
 import sys
 from pathlib import Path
 
 
+def parallel_args():
+    """
+    pytest-xdist arguments spreading tests over all CPU cores.
+
+    Each test class (or module, for module-level tests) stays on one worker,
+    so large modules such as test_health.py are split by class while class
+    and module fixtures are still built once per worker. Returns no
+    arguments with --serial or when pytest-xdist is not installed.
+    """
+    if "--serial" in sys.argv[2:] or importlib.util.find_spec("xdist") is None:
+        return []
+    return ["-n", "auto", "--dist=loadscope"]
+
+
 def run_command(cmd, description):
     """Run a command and handle errors."""
     print(f"\n{'=' * 60}")
@@ -31,22 +46,28 @@ def run_command(cmd, description):
 def main():
     """Main test runner."""
     if len(sys.argv) < 2:
-        print("Usage: python run_tests.py [unit|integration|all|coverage]")
+        print(
+            "Usage: python run_tests.py [unit|integration|all|coverage|quick|slow] [--serial]"
+        )
         print("\nOptions:")
         print("  unit        - Run unit tests only")
         print("  integration - Run integration tests only")
         print("  all         - Run all tests")
         print("  coverage    - Run all tests with detailed coverage report")
         print("  quick       - Run tests quickly (no coverage)")
+        print("  slow        - Run only slow tests (real ML inference)")
+        print("\nSlow tests are skipped except by coverage and slow.")
+        print("Tests run in parallel when pytest-xdist is installed;")
+        print("pass --serial to run them in a single process.")
         sys.exit(1)
 
     test_type = sys.argv[1].lower()
 
     # Base pytest command
-    base_cmd = ["python", "-m", "pytest"]
+    base_cmd = ["python", "-m", "pytest"] + parallel_args()
 
     if test_type == "unit":
-        cmd = base_cmd + ["tests/unit/", "-m", "not slow"]
+        cmd = base_cmd + ["tests/unit/"]
         success = run_command(cmd, "Unit Tests")
 
     elif test_type == "integration":
@@ -58,12 +79,16 @@ def main():
         success = run_command(cmd, "All Tests")
 
     elif test_type == "coverage":
+        # An empty -m clears pytest.ini's "not slow" so slow tests count too
         cmd = base_cmd + [
             "tests/",
+            "-m",
+            "",
             "--cov=app",
             "--cov-report=term-missing",
             "--cov-report=html:htmlcov",
             "--cov-report=xml:coverage.xml",
+            "--cov-fail-under=80",
         ]
         success = run_command(cmd, "All Tests with Coverage")
 
@@ -77,6 +102,10 @@ def main():
         cmd = base_cmd + ["tests/", "--no-cov", "-x"]
         success = run_command(cmd, "Quick Test Run")
 
+    elif test_type == "slow":
+        cmd = base_cmd + ["tests/", "-m", "slow"]
+        success = run_command(cmd, "Slow Tests")
+
     else:
         print(f"Unknown test type: {test_type}")
         sys.exit(1)
@@ -9,6 +9,7 @@ Usage:
     cd 2-ml-service
     python scripts/generate_jwt.py --user-id test123 --expires-in 3600
     python scripts/generate_jwt.py --user-id admin --username admin_user --expires-in 7200
+    python scripts/generate_jwt.py --user-id loadtest --count 50
 """
 
 import argparse
@@ -66,6 +67,9 @@ Examples:
 
   Generate token for testing predictions:
     python scripts/generate_jwt.py --user-id tester --expires-in 600
+
+  Generate 50 tokens (users loadtest_0 ... loadtest_49) in one run:
+    python scripts/generate_jwt.py --user-id loadtest --count 50
         """,
     )
 
@@ -82,7 +86,22 @@ Examples:
         help="Token expiration time in seconds (default: 3600 = 1 hour)",
     )
 
+    parser.add_argument(
+        "--count",
+        type=int,
+        default=1,
+        help="Number of tokens to generate in one run (default: 1)",
+    )
+
+    parser.add_argument(
+        "--user-id-pattern",
+        default="{user_id}_{i}",
+        help="User ID format when --count > 1 (default: {user_id}_{i})",
+    )
+
     args = parser.parse_args()
+    if args.count < 1:
+        parser.error("--count must be at least 1")
 
     try:
         print("🔑 JWT Token Generator for ML Service")
@@ -92,6 +111,21 @@ Examples:
         print("Loading configuration...")
         config_manager.load_config()
 
+        if args.count > 1:
+            # Configuration and signing key are loaded once for the whole batch
+            print(f"Generating {args.count} tokens for users: {args.user_id_pattern}")
+            print(
+                f"Expires in: {args.expires_in} seconds ({args.expires_in // 60} minutes)"
+            )
+            print("=" * 50)
+            for i in range(args.count):
+                user_id = args.user_id_pattern.format(user_id=args.user_id, i=i)
+                token = generate_token(
+                    user_id=user_id, username=args.username, expires_in=args.expires_in
+                )
+                print(f"{user_id}\t{token}")
+            return
+
         # Generate token
         print(f"Generating token for user: {args.user_id}")
         if args.username:
@@ -0,0 +1,61 @@
+"""
+Request payloads shared by several test modules.
+"""
+
+import pytest
+
+# Invalid payloads, one parametrize case each (the test ids name the defect)
+INVALID_CASES = [
+    # Out of range values
+    pytest.param(
+        {
+            "pclass": 4,  # Invalid class
+            "sex": "female",
+            "age": 25.0,
+            "sibsp": 0,
+            "parch": 0,
+            "fare": 100.0,
+            "embarked": "S",
+        },
+        id="bad_pclass",
+    ),
+    # Invalid string values
+    pytest.param(
+        {
+            "pclass": 1,
+            "sex": "other",  # Invalid sex
+            "age": 25.0,
+            "sibsp": 0,
+            "parch": 0,
+            "fare": 100.0,
+            "embarked": "S",
+        },
+        id="bad_sex",
+    ),
+    # Negative values
+    pytest.param(
+        {
+            "pclass": 1,
+            "sex": "male",
+            "age": -5.0,  # Invalid age
+            "sibsp": 0,
+            "parch": 0,
+            "fare": 100.0,
+            "embarked": "S",
+        },
+        id="negative_age",
+    ),
+    # SQL injection attempt
+    pytest.param(
+        {
+            "pclass": 1,
+            "sex": "male'; DROP TABLE users; --",
+            "age": 25.0,
+            "sibsp": 0,
+            "parch": 0,
+            "fare": 100.0,
+            "embarked": "S",
+        },
+        id="sql_injection",
+    ),
+]
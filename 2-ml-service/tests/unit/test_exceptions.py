@@ -4,6 +4,7 @@ Unit tests for custom exception classes.
 Tests the improved exception handling with more specific HTTP status codes.
 """
 
+import pytest
 from fastapi import status
 
 from app.core.exceptions import (
@@ -19,27 +20,95 @@ from app.core.exceptions import (
 )
 
 
-class TestImprovedExceptions:
-    """Test improved exception classes with specific status codes."""
-
-    def test_prediction_input_error_returns_400(self):
-        """Test PredictionInputError returns 400 Bad Request."""
-        exc = PredictionInputError("Invalid input data")
+_FIELD_ERRORS = {
+    "age": ["Must be between 0 and 120"],
+    "fare": ["Must be positive"],
+}
+
+# (exception, status code, error code, message, expected details)
+EXC_CASES = [
+    pytest.param(
+        PredictionInputError("Invalid input data"),
+        status.HTTP_400_BAD_REQUEST,
+        "PREDICTION_INPUT_ERROR",
+        "Invalid input data",
+        {},
+        id="prediction_input_400",
+    ),
+    pytest.param(
+        ModelUnavailableError("Models not ready", model_name="logistic_regression"),
+        status.HTTP_503_SERVICE_UNAVAILABLE,
+        "MODEL_UNAVAILABLE",
+        "Models not ready",
+        {"model_name": "logistic_regression"},
+        id="model_unavailable_503",
+    ),
+    pytest.param(
+        ModelNotLoadedError("decision_tree"),
+        status.HTTP_503_SERVICE_UNAVAILABLE,
+        "MODEL_NOT_LOADED",
+        "ML model 'decision_tree' is not loaded",
+        {},
+        id="model_not_loaded_503",
+    ),
+    pytest.param(
+        ValidationError("Validation failed", field_errors=_FIELD_ERRORS),
+        status.HTTP_400_BAD_REQUEST,
+        "VALIDATION_ERROR",
+        "Validation failed",
+        {"field_errors": _FIELD_ERRORS},
+        id="validation_400",
+    ),
+    pytest.param(
+        AuthenticationError("Token expired"),
+        status.HTTP_401_UNAUTHORIZED,
+        "AUTHENTICATION_ERROR",
+        "Token expired",
+        {},
+        id="authentication_401",
+    ),
+    pytest.param(
+        AuthorizationError("Access denied", required_permission="admin"),
+        status.HTTP_403_FORBIDDEN,
+        "AUTHORIZATION_ERROR",
+        "Access denied",
+        {"required_permission": "admin"},
+        id="authorization_403",
+    ),
+    pytest.param(
+        ConfigurationError("Missing config", config_key="database.url"),
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
+        "CONFIGURATION_ERROR",
+        "Missing config",
+        {"config_key": "database.url"},
+        id="configuration_500",
+    ),
+    pytest.param(
+        ExternalServiceError(
+            "Service down", service_name="auth_service", service_status=503
+        ),
+        status.HTTP_502_BAD_GATEWAY,
+        "EXTERNAL_SERVICE_ERROR",
+        "Service down",
+        {"service_name": "auth_service", "service_status": 503},
+        id="external_service_502",
+    ),
+]
 
-        assert exc.status_code == status.HTTP_400_BAD_REQUEST
-        assert exc.error_code == "PREDICTION_INPUT_ERROR"
-        assert exc.message == "Invalid input data"
 
-    def test_model_unavailable_error_returns_503(self):
-        """Test ModelUnavailableError returns 503 Service Unavailable."""
-        exc = ModelUnavailableError(
-            "Models not ready", model_name="logistic_regression"
-        )
+class TestImprovedExceptions:
+    """Test improved exception classes with specific status codes."""
 
-        assert exc.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
-        assert exc.error_code == "MODEL_UNAVAILABLE"
-        assert exc.message == "Models not ready"
-        assert exc.details["model_name"] == "logistic_regression"
+    @pytest.mark.parametrize(
+        "exc, status_code, error_code, message, details", EXC_CASES
+    )
+    def test_exception_shape(self, exc, status_code, error_code, message, details):
+        """Test each exception's status code, error code, message and details."""
+        assert exc.status_code == status_code
+        assert exc.error_code == error_code
+        assert exc.message == message
+        for key, value in details.items():
+            assert exc.details[key] == value
 
     def test_prediction_error_with_custom_status_code(self):
         """Test PredictionError can accept custom status codes."""
@@ -53,60 +122,6 @@ class TestImprovedExceptions:
         )
         assert exc_custom.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
 
-    def test_model_not_loaded_error_returns_503(self):
-        """Test ModelNotLoadedError returns 503 Service Unavailable."""
-        exc = ModelNotLoadedError("decision_tree")
-
-        assert exc.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
-        assert exc.error_code == "MODEL_NOT_LOADED"
-        assert "decision_tree" in exc.message
-
-    def test_validation_error_returns_400(self):
-        """Test ValidationError returns 400 Bad Request."""
-        field_errors = {
-            "age": ["Must be between 0 and 120"],
-            "fare": ["Must be positive"],
-        }
-        exc = ValidationError("Validation failed", field_errors=field_errors)
-
-        assert exc.status_code == status.HTTP_400_BAD_REQUEST
-        assert exc.error_code == "VALIDATION_ERROR"
-        assert exc.details["field_errors"] == field_errors
-
-    def test_authentication_error_returns_401(self):
-        """Test AuthenticationError returns 401 Unauthorized."""
-        exc = AuthenticationError("Token expired")
-
-        assert exc.status_code == status.HTTP_401_UNAUTHORIZED
-        assert exc.error_code == "AUTHENTICATION_ERROR"
-
-    def test_authorization_error_returns_403(self):
-        """Test AuthorizationError returns 403 Forbidden."""
-        exc = AuthorizationError("Access denied", required_permission="admin")
-
-        assert exc.status_code == status.HTTP_403_FORBIDDEN
-        assert exc.error_code == "AUTHORIZATION_ERROR"
-        assert exc.details["required_permission"] == "admin"
-
-    def test_configuration_error_returns_500(self):
-        """Test ConfigurationError returns 500 Internal Server Error."""
-        exc = ConfigurationError("Missing config", config_key="database.url")
-
-        assert exc.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-        assert exc.error_code == "CONFIGURATION_ERROR"
-        assert exc.details["config_key"] == "database.url"
-
-    def test_external_service_error_returns_502(self):
-        """Test ExternalServiceError returns 502 Bad Gateway."""
-        exc = ExternalServiceError(
-            "Service down", service_name="auth_service", service_status=503
-        )
-
-        assert exc.status_code == status.HTTP_502_BAD_GATEWAY
-        assert exc.error_code == "EXTERNAL_SERVICE_ERROR"
-        assert exc.details["service_name"] == "auth_service"
-        assert exc.details["service_status"] == 503
-
     def test_error_detail_conversion(self):
         """Test exception to ErrorDetail conversion."""
         exc = PredictionInputError("Bad data", field_errors={"age": ["Invalid"]})
@@ -9,11 +9,135 @@ Tests comprehensive health monitoring including:
 - Startup vs runtime check separation
 """
 
-import pytest
+import asyncio
+import copy
+import itertools
+import os
+import sys
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
+import pytest
+
 from app.services.health_checker import EnhancedHealthChecker, HealthStatus, HealthCheck
 
+# The package re-exports the checker instance under the module's name
+health_module = sys.modules["app.services.health_checker"]
+
+
+# psutil.virtual_memory() / disk_usage() payloads; plain data, so shared freely
+_GB = 1024 * 1024 * 1024
+_MB = 1024 * 1024
+HEALTHY_MEM = SimpleNamespace(
+    percent=60.0, available=4 * _GB, total=8 * _GB, used=4 * _GB
+)
+DEGRADED_MEM = SimpleNamespace(
+    percent=88.0, available=512 * _MB, total=4 * _GB, used=3.5 * _GB
+)
+UNHEALTHY_MEM = SimpleNamespace(
+    percent=96.0, available=100 * _MB, total=4 * _GB, used=3.9 * _GB
+)
+HEALTHY_DISK = SimpleNamespace(
+    percent=70.0, free=100 * _GB, total=200 * _GB, used=100 * _GB
+)
+UNHEALTHY_DISK = SimpleNamespace(
+    percent=97.0, free=1 * _GB, total=50 * _GB, used=49 * _GB
+)
+
+
+# Stat results for the model files under the mock service's models_dir
+MODEL_FILE_STAT = SimpleNamespace(st_size=1024, st_mtime=1640995200)
+MODEL_FILES = {
+    os.path.join("/mock/models", name): MODEL_FILE_STAT
+    for name in (
+        "decision_tree_model.pkl",
+        "evaluation_results.json",
+        "label_encoders.pkl",
+        "logistic_model.pkl",
+    )
+}
+
+
+def install_fake_fs(monkeypatch, files):
+    """
+    Point the health checker's os at an in-memory filesystem.
+
+    files maps each existing path to its stat result, or to an exception
+    that os.stat should raise for it.
+    """
+
+    def stat(path):
+        entry = files[path]
+        if isinstance(entry, BaseException):
+            raise entry
+        return entry
+
+    fake_os = SimpleNamespace(
+        path=SimpleNamespace(join=os.path.join, exists=files.__contains__),
+        stat=stat,
+    )
+    monkeypatch.setattr(health_module, "os", fake_os)
+
+
+@pytest.fixture(autouse=True)
+def _fast_clock(monkeypatch):
+    """Deterministic monotonic clock for the checks: each reading advances 1ms."""
+    ticks = itertools.count(step=1_000_000)
+    monkeypatch.setattr(
+        health_module, "time", SimpleNamespace(monotonic_ns=ticks.__next__)
+    )
+
+
+@pytest.fixture(scope="session")
+def ml_service_prototype():
+    """Populated ML service stand-in, built once; tests get shallow copies."""
+    return SimpleNamespace(
+        is_loaded=True,
+        models_dir="/mock/models",
+        logistic_model=Mock(),
+        decision_tree_model=Mock(),
+        label_encoders={"sex": Mock(), "embarked": Mock()},
+        model_accuracy={
+            "logistic_regression": 0.832,
+            "decision_tree": 0.802,
+            "ensemble": 0.817,
+        },
+        get_feature_columns=Mock(
+            return_value=[
+                "pclass",
+                "sex",
+                "age",
+                "sibsp",
+                "parch",
+                "fare",
+                "embarked",
+            ]
+        ),
+        # Preprocessor and its stats
+        preprocessor=SimpleNamespace(
+            preprocessing_stats={
+                "age_median": 28.0,
+                "embarked_mode": "S",
+                "fare_median": 14.45,
+            }
+        ),
+    )
+
+
+@pytest.fixture(scope="session")
+def config_manager_prototype():
+    """Valid configuration manager stand-in, built once; tests get shallow copies."""
+    return SimpleNamespace(
+        config=SimpleNamespace(
+            environment="test",
+            api=SimpleNamespace(),
+            jwt=SimpleNamespace(
+                private_key="test_key", public_key="test_key", algorithm="RS256"
+            ),
+            logging=SimpleNamespace(),
+        )
+    )
+
 
 class TestHealthCheck:
     """Test the HealthCheck data class."""
@@ -55,56 +179,37 @@ class TestHealthCheck:
 class TestEnhancedHealthChecker:
     """Test the EnhancedHealthChecker class."""
 
-    @pytest.fixture
-    def health_checker(self):
-        """Create EnhancedHealthChecker instance for testing."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def health_checker(cls):
+        """Create EnhancedHealthChecker instance, shared by the class (it only holds a logger)."""
         return EnhancedHealthChecker()
 
     @pytest.fixture
-    def mock_ml_service(self):
+    def mock_ml_service(self, monkeypatch, ml_service_prototype):
         """Mock ML service for health check tests."""
-        with patch("app.services.health_checker.ml_service") as mock_service:
-            mock_service.is_loaded = True
-            mock_service.models_dir = "/mock/models"
-            mock_service.logistic_model = Mock()
-            mock_service.decision_tree_model = Mock()
-            mock_service.label_encoders = {"sex": Mock(), "embarked": Mock()}
-            mock_service.model_accuracy = {
-                "logistic_regression": 0.832,
-                "decision_tree": 0.802,
-                "ensemble": 0.817,
-            }
-            mock_service.get_feature_columns.return_value = [
-                "pclass",
-                "sex",
-                "age",
-                "sibsp",
-                "parch",
-                "fare",
-                "embarked",
-            ]
-            # Mock preprocessor and its stats
-            mock_service.preprocessor = Mock()
-            mock_service.preprocessor.preprocessing_stats = {
-                "age_median": 28.0,
-                "embarked_mode": "S",
-                "fare_median": 14.45,
-            }
-            yield mock_service
+        mock_service = copy.copy(ml_service_prototype)
+        monkeypatch.setattr(health_module, "ml_service", mock_service)
+        return mock_service
 
     @pytest.fixture
-    def mock_config_manager(self):
+    def mock_config_manager(self, monkeypatch, config_manager_prototype):
         """Mock configuration manager."""
-        with patch("app.services.health_checker.config_manager") as mock_config:
-            mock_config.config = Mock()
-            mock_config.config.environment = "test"
-            mock_config.config.api = Mock()
-            mock_config.config.jwt = Mock()
-            mock_config.config.jwt.private_key = "test_key"
-            mock_config.config.jwt.public_key = "test_key"
-            mock_config.config.jwt.algorithm = "RS256"
-            mock_config.config.logging = Mock()
-            yield mock_config
+        mock_config = copy.copy(config_manager_prototype)
+        monkeypatch.setattr(health_module, "config_manager", mock_config)
+        return mock_config
+
+    @pytest.fixture
+    def psutil_readings(self, monkeypatch):
+        """Install fixed CPU, memory and disk readings on psutil."""
+
+        def install(cpu, memory, disk):
+            psutil = health_module.psutil
+            monkeypatch.setattr(psutil, "cpu_percent", lambda *args, **kwargs: cpu)
+            monkeypatch.setattr(psutil, "virtual_memory", lambda: memory)
+            monkeypatch.setattr(psutil, "disk_usage", lambda path: disk)
+
+        return install
 
     @pytest.mark.asyncio
     async def test_check_ml_models_healthy(self, health_checker, mock_ml_service):
@@ -116,14 +221,14 @@ class TestEnhancedHealthChecker:
         assert "models loaded" in result.message.lower()
         assert result.details["models_loaded"] is True
         assert "logistic_regression" in result.details["accuracy"]
+        assert result.duration_ms == 1.0
 
-    @pytest.mark.asyncio
-    async def test_check_ml_models_not_loaded(self, health_checker):
+    def test_check_ml_models_not_loaded(self, health_checker):
         """Test ML models health check when models are not loaded."""
         with patch("app.services.health_checker.ml_service") as mock_service:
             mock_service.is_loaded = False
 
-            result = await health_checker.check_ml_models()
+            result = asyncio.run(health_checker.check_ml_models())
 
             assert result.status == HealthStatus.UNHEALTHY
             assert "not loaded" in result.message.lower()
@@ -186,13 +291,12 @@ class TestEnhancedHealthChecker:
             assert result.status == HealthStatus.HEALTHY
             assert "ready" in result.message.lower()
 
-    @pytest.mark.asyncio
-    async def test_check_preprocessor_not_loaded(self, health_checker):
+    def test_check_preprocessor_not_loaded(self, health_checker):
         """Test preprocessor health check when not loaded."""
         with patch("app.services.health_checker.ml_service") as mock_service:
             mock_service.preprocessor = None
 
-            result = await health_checker.check_preprocessor()
+            result = asyncio.run(health_checker.check_preprocessor())
 
             assert result.status == HealthStatus.UNHEALTHY
             assert "not loaded" in result.message.lower()
@@ -209,13 +313,12 @@ class TestEnhancedHealthChecker:
         assert "valid" in result.message.lower()
         assert result.details["environment"] == "test"
 
-    @pytest.mark.asyncio
-    async def test_check_configuration_not_loaded(self, health_checker):
+    def test_check_configuration_not_loaded(self, health_checker):
         """Test configuration health check when config not loaded."""
         with patch("app.services.health_checker.config_manager") as mock_config:
             mock_config.config = None
 
-            result = await health_checker.check_configuration()
+            result = asyncio.run(health_checker.check_configuration())
 
             assert result.status == HealthStatus.UNHEALTHY
             assert "not loaded" in result.message.lower()
@@ -225,10 +328,9 @@ class TestEnhancedHealthChecker:
         """Test configuration health check with missing sections."""
         with patch("app.services.health_checker.config_manager") as mock_config:
             # Create mock config that only has api and logging, not jwt
-            mock_config.config = Mock(spec=["api", "logging", "environment"])
-            mock_config.config.api = Mock()
-            mock_config.config.logging = Mock()
-            mock_config.config.environment = "test"
+            mock_config.config = SimpleNamespace(
+                api=SimpleNamespace(), logging=SimpleNamespace(), environment="test"
+            )
 
             result = await health_checker.check_configuration()
 
@@ -237,90 +339,55 @@ class TestEnhancedHealthChecker:
             assert "jwt" in result.details["missing_sections"]
 
     @pytest.mark.asyncio
-    async def test_check_system_resources_healthy(self, health_checker):
-        """Test system resources health check with good resources."""
-        with (
-            patch("app.services.health_checker.psutil.cpu_percent", return_value=50.0),
-            patch("app.services.health_checker.psutil.virtual_memory") as mock_memory,
-            patch("app.services.health_checker.psutil.disk_usage") as mock_disk,
-        ):
-            # Mock healthy memory usage with all required attributes
-            mock_memory.return_value = Mock(
-                percent=60.0,
-                available=4 * 1024 * 1024 * 1024,
-                total=8 * 1024 * 1024 * 1024,
-                used=4 * 1024 * 1024 * 1024,
-            )
-            # Mock healthy disk usage with all required attributes
-            mock_disk.return_value = Mock(
-                percent=70.0,
-                free=100 * 1024 * 1024 * 1024,
-                total=200 * 1024 * 1024 * 1024,
-                used=100 * 1024 * 1024 * 1024,
-            )
-
-            result = await health_checker.check_system_resources()
-
-            assert result.status == HealthStatus.HEALTHY
-            assert result.details["cpu"]["usage_percent"] == 50.0
-            assert result.details["memory"]["usage_percent"] == 60.0
-            assert result.details["disk"]["usage_percent"] == 70.0
-
-    @pytest.mark.asyncio
-    async def test_check_system_resources_degraded(self, health_checker):
-        """Test system resources health check with degraded resources."""
-        with (
-            patch("app.services.health_checker.psutil.cpu_percent", return_value=85.0),
-            patch("app.services.health_checker.psutil.virtual_memory") as mock_memory,
-            patch("app.services.health_checker.psutil.disk_usage") as mock_disk,
-        ):
-            # High memory usage with all required attributes
-            mock_memory.return_value = Mock(
-                percent=88.0,
-                available=512 * 1024 * 1024,
-                total=4 * 1024 * 1024 * 1024,
-                used=3.5 * 1024 * 1024 * 1024,
-            )
-            # Normal disk usage with all required attributes
-            mock_disk.return_value = Mock(
-                percent=70.0,
-                free=100 * 1024 * 1024 * 1024,
-                total=200 * 1024 * 1024 * 1024,
-                used=100 * 1024 * 1024 * 1024,
-            )
-
-            result = await health_checker.check_system_resources()
-
-            assert result.status == HealthStatus.DEGRADED
-            assert "high resource usage" in result.message.lower()
-
-    @pytest.mark.asyncio
-    async def test_check_system_resources_unhealthy(self, health_checker):
-        """Test system resources health check with critical resources."""
-        with (
-            patch("app.services.health_checker.psutil.cpu_percent", return_value=98.0),
-            patch("app.services.health_checker.psutil.virtual_memory") as mock_memory,
-            patch("app.services.health_checker.psutil.disk_usage") as mock_disk,
-        ):
-            # Critical memory usage with all required attributes
-            mock_memory.return_value = Mock(
-                percent=96.0,
-                available=100 * 1024 * 1024,
-                total=4 * 1024 * 1024 * 1024,
-                used=3.9 * 1024 * 1024 * 1024,
-            )
-            # Critical disk usage with all required attributes
-            mock_disk.return_value = Mock(
-                percent=97.0,
-                free=1 * 1024 * 1024 * 1024,
-                total=50 * 1024 * 1024 * 1024,
-                used=49 * 1024 * 1024 * 1024,
-            )
+    @pytest.mark.parametrize(
+        "cpu,memory,disk,expected_status,expected_message",
+        [
+            pytest.param(
+                50.0,
+                HEALTHY_MEM,
+                HEALTHY_DISK,
+                HealthStatus.HEALTHY,
+                "within normal limits",
+                id="healthy",
+            ),
+            pytest.param(
+                85.0,
+                DEGRADED_MEM,
+                HEALTHY_DISK,
+                HealthStatus.DEGRADED,
+                "high resource usage",
+                id="degraded",
+            ),
+            pytest.param(
+                98.0,
+                UNHEALTHY_MEM,
+                UNHEALTHY_DISK,
+                HealthStatus.UNHEALTHY,
+                "critical resource usage",
+                id="unhealthy",
+            ),
+        ],
+    )
+    async def test_check_system_resources(
+        self,
+        health_checker,
+        psutil_readings,
+        cpu,
+        memory,
+        disk,
+        expected_status,
+        expected_message,
+    ):
+        """Test system resources health check across resource levels."""
+        psutil_readings(cpu, memory, disk)
 
-            result = await health_checker.check_system_resources()
+        result = await health_checker.check_system_resources()
 
-            assert result.status == HealthStatus.UNHEALTHY
-            assert "critical resource usage" in result.message.lower()
+        assert result.status == expected_status
+        assert expected_message in result.message.lower()
+        assert result.details["cpu"]["usage_percent"] == cpu
+        assert result.details["memory"]["usage_percent"] == memory.percent
+        assert result.details["disk"]["usage_percent"] == disk.percent
 
     @pytest.mark.asyncio
     async def test_check_system_resources_exception(self, health_checker):
@@ -335,153 +402,166 @@ class TestEnhancedHealthChecker:
             assert "psutil error" in result.message.lower()
 
     @pytest.mark.asyncio
-    async def test_check_model_files_healthy(self, health_checker, mock_ml_service):
+    async def test_check_model_files_healthy(
+        self, monkeypatch, health_checker, mock_ml_service
+    ):
         """Test model files health check with accessible files."""
-        with (
-            patch("app.services.health_checker.os.path.exists", return_value=True),
-            patch("app.services.health_checker.os.stat") as mock_stat,
-        ):
-            # Mock file stat information
-            mock_stat.return_value = Mock(st_size=1024, st_mtime=1640995200)
+        install_fake_fs(monkeypatch, MODEL_FILES)
 
-            result = await health_checker.check_model_files()
+        result = await health_checker.check_model_files()
 
-            assert result.status == HealthStatus.HEALTHY
-            assert "accessible" in result.message.lower()
+        assert result.status == HealthStatus.HEALTHY
+        assert "accessible" in result.message.lower()
 
     @pytest.mark.asyncio
-    async def test_check_model_files_missing(self, health_checker, mock_ml_service):
+    async def test_check_model_files_missing(
+        self, monkeypatch, health_checker, mock_ml_service
+    ):
         """Test model files health check with missing files."""
+        # Simulate missing logistic model
+        files = {
+            path: stat
+            for path, stat in MODEL_FILES.items()
+            if not path.endswith("logistic_model.pkl")
+        }
+        install_fake_fs(monkeypatch, files)
 
-        def mock_exists(path):
-            # Simulate missing logistic model
-            if "logistic_model.pkl" in path:
-                return False
-            return True
-
-        with (
-            patch(
-                "app.services.health_checker.os.path.exists", side_effect=mock_exists
-            ),
-            patch("app.services.health_checker.os.stat") as mock_stat,
-        ):
-            # Mock file stat for existing files
-            mock_stat.return_value = Mock(st_size=1024, st_mtime=1640995200)
-
-            result = await health_checker.check_model_files()
+        result = await health_checker.check_model_files()
 
-            assert result.status == HealthStatus.UNHEALTHY
-            assert "missing" in result.message.lower()
-            assert "logistic_model.pkl" in str(result.details["missing_files"])
+        assert result.status == HealthStatus.UNHEALTHY
+        assert "missing" in result.message.lower()
+        assert "logistic_model.pkl" in str(result.details["missing_files"])
 
     @pytest.mark.asyncio
     async def test_check_model_files_permission_denied(
-        self, health_checker, mock_ml_service
+        self, monkeypatch, health_checker, mock_ml_service
     ):
         """Test model files health check with permission issues."""
-        with (
-            patch("app.services.health_checker.os.path.exists", return_value=True),
-            patch(
-                "app.services.health_checker.os.stat",
-                side_effect=PermissionError("Permission denied"),
-            ),
-        ):
-            result = await health_checker.check_model_files()
+        denied = PermissionError("Permission denied")
+        install_fake_fs(monkeypatch, dict.fromkeys(MODEL_FILES, denied))
 
-            assert result.status == HealthStatus.UNHEALTHY
-            assert "permission" in result.message.lower()
+        result = await health_checker.check_model_files()
+
+        assert result.status == HealthStatus.UNHEALTHY
+        assert "permission" in result.message.lower()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "cpu,memory,expected_status,expected_healthy,expected_degraded",
+        [
+            pytest.param(50.0, HEALTHY_MEM, "healthy", 5, 0, id="healthy"),
+            # High memory usage causes degraded status
+            pytest.param(85.0, DEGRADED_MEM, "degraded", 4, 1, id="degraded"),
+        ],
+    )
+    async def test_run_all_checks(
+        self,
+        monkeypatch,
+        health_checker,
+        mock_ml_service,
+        mock_config_manager,
+        psutil_readings,
+        cpu,
+        memory,
+        expected_status,
+        expected_healthy,
+        expected_degraded,
+    ):
+        """Test running all health checks with healthy and degraded systems."""
+        psutil_readings(cpu, memory, HEALTHY_DISK)
+        install_fake_fs(monkeypatch, MODEL_FILES)
+
+        result = await health_checker.run_all_checks()
+
+        assert result["status"] == expected_status
+        assert result["summary"]["total_checks"] == 5
+        assert result["summary"]["healthy"] == expected_healthy
+        assert result["summary"]["degraded"] == expected_degraded
+        assert result["summary"]["unhealthy"] == 0
+        assert "timestamp" in result
+        assert "duration_ms" in result
 
     @pytest.mark.asyncio
-    async def test_run_all_checks_healthy(
-        self, health_checker, mock_ml_service, mock_config_manager
+    async def test_run_all_checks_unexpected_exception(
+        self, monkeypatch, health_checker, mock_ml_service, mock_config_manager
     ):
-        """Test running all health checks with healthy system."""
+        """Test that a check raising unexpectedly is counted as unhealthy."""
+        install_fake_fs(monkeypatch, MODEL_FILES)
         with (
-            patch("app.services.health_checker.psutil.cpu_percent", return_value=50.0),
-            patch("app.services.health_checker.psutil.virtual_memory") as mock_memory,
-            patch("app.services.health_checker.psutil.disk_usage") as mock_disk,
-            patch("app.services.health_checker.os.path.exists", return_value=True),
-            patch("app.services.health_checker.os.stat") as mock_stat,
+            patch.object(
+                health_checker,
+                "check_system_resources",
+                side_effect=RuntimeError("boom"),
+            ),
         ):
-            # Mock healthy system resources with all required attributes
-            mock_memory.return_value = Mock(
-                percent=60.0,
-                available=4 * 1024 * 1024 * 1024,
-                total=8 * 1024 * 1024 * 1024,
-                used=4 * 1024 * 1024 * 1024,
-            )
-            mock_disk.return_value = Mock(
-                percent=70.0,
-                free=100 * 1024 * 1024 * 1024,
-                total=200 * 1024 * 1024 * 1024,
-                used=100 * 1024 * 1024 * 1024,
-            )
-            # Mock file stat for model files
-            mock_stat.return_value = Mock(st_size=1024, st_mtime=1640995200)
-
             result = await health_checker.run_all_checks()
 
-            assert result["status"] == "healthy"
+            assert result["status"] == "unhealthy"
+            assert (
+                result["checks"]["system_resources_error"]["status"] == "unhealthy"
+            )
             assert result["summary"]["total_checks"] == 5
-            assert result["summary"]["healthy"] == 5
-            assert result["summary"]["degraded"] == 0
-            assert result["summary"]["unhealthy"] == 0
-            assert "timestamp" in result
-            assert "duration_ms" in result
+            assert result["summary"]["healthy"] == 4
+            assert result["summary"]["unhealthy"] == 1
 
     @pytest.mark.asyncio
-    async def test_run_all_checks_degraded(
-        self, health_checker, mock_ml_service, mock_config_manager
+    async def test_run_all_checks_several_exceptions(
+        self, monkeypatch, health_checker, mock_ml_service, mock_config_manager
     ):
-        """Test running all health checks with degraded system."""
+        """Test that each check raising unexpectedly keeps its own entry."""
+        install_fake_fs(monkeypatch, MODEL_FILES)
         with (
-            patch("app.services.health_checker.psutil.cpu_percent", return_value=85.0),
-            patch("app.services.health_checker.psutil.virtual_memory") as mock_memory,
-            patch("app.services.health_checker.psutil.disk_usage") as mock_disk,
-            patch("app.services.health_checker.os.path.exists", return_value=True),
-            patch("app.services.health_checker.os.stat") as mock_stat,
+            patch.object(
+                health_checker,
+                "check_system_resources",
+                side_effect=RuntimeError("boom"),
+            ),
+            patch.object(
+                health_checker,
+                "check_model_files",
+                side_effect=OSError("disk gone"),
+            ),
         ):
-            # High memory usage causes degraded status, with all required attributes
-            mock_memory.return_value = Mock(
-                percent=88.0,
-                available=512 * 1024 * 1024,
-                total=4 * 1024 * 1024 * 1024,
-                used=3.5 * 1024 * 1024 * 1024,
-            )
-            mock_disk.return_value = Mock(
-                percent=70.0,
-                free=100 * 1024 * 1024 * 1024,
-                total=200 * 1024 * 1024 * 1024,
-                used=100 * 1024 * 1024 * 1024,
-            )
-            # Mock file stat for model files
-            mock_stat.return_value = Mock(st_size=1024, st_mtime=1640995200)
-
             result = await health_checker.run_all_checks()
 
-            assert result["status"] == "degraded"
-            assert result["summary"]["degraded"] > 0
+        assert result["checks"]["system_resources_error"]["details"] == {
+            "error": "boom",
+            "error_type": "RuntimeError",
+        }
+        assert result["checks"]["model_files_error"]["details"] == {
+            "error": "disk gone",
+            "error_type": "OSError",
+        }
+        assert len(result["checks"]) == result["summary"]["total_checks"] == 5
+        assert result["summary"]["unhealthy"] == 2
+
+    @pytest.mark.asyncio
+    async def test_run_all_checks_shares_timestamp(
+        self, monkeypatch, health_checker, mock_ml_service, mock_config_manager
+    ):
+        """Test that all checks in one run share the response timestamp."""
+        install_fake_fs(monkeypatch, MODEL_FILES)
+
+        result = await health_checker.run_all_checks()
+
+        timestamps = {check["timestamp"] for check in result["checks"].values()}
+        assert timestamps == {result["timestamp"]}
 
     @pytest.mark.asyncio
     async def test_run_startup_checks_success(
-        self, health_checker, mock_ml_service, mock_config_manager
+        self, monkeypatch, health_checker, mock_ml_service, mock_config_manager
     ):
         """Test running startup checks with all checks passing."""
-        with (
-            patch("app.services.health_checker.os.path.exists", return_value=True),
-            patch("app.services.health_checker.os.stat") as mock_stat,
-        ):
-            # Mock file stat for model files
-            mock_stat.return_value = Mock(st_size=1024, st_mtime=1640995200)
+        install_fake_fs(monkeypatch, MODEL_FILES)
 
-            result = await health_checker.run_startup_checks()
+        result = await health_checker.run_startup_checks()
 
-            assert result["status"] == "startup_success"
-            assert len(result["checks"]) == 4
-            assert "ml_models" in result["checks"]
-            assert "preprocessor" in result["checks"]
-            assert "configuration" in result["checks"]
-            assert "model_files" in result["checks"]
+        assert result["status"] == "startup_success"
+        assert len(result["checks"]) == 4
+        assert "ml_models" in result["checks"]
+        assert "preprocessor" in result["checks"]
+        assert "configuration" in result["checks"]
+        assert "model_files" in result["checks"]
 
     @pytest.mark.asyncio
     async def test_run_startup_checks_failure(self, health_checker):
@@ -507,37 +587,22 @@ class TestEnhancedHealthChecker:
 
     @pytest.mark.asyncio
     async def test_logging_during_health_checks(
-        self, health_checker, mock_ml_service, mock_config_manager
+        self,
+        monkeypatch,
+        health_checker,
+        mock_ml_service,
+        mock_config_manager,
+        psutil_readings,
     ):
         """Test that health checks produce appropriate logging."""
-        with (
-            patch("app.services.health_checker.psutil.cpu_percent", return_value=50.0),
-            patch("app.services.health_checker.psutil.virtual_memory") as mock_memory,
-            patch("app.services.health_checker.psutil.disk_usage") as mock_disk,
-            patch("app.services.health_checker.os.path.exists", return_value=True),
-            patch("app.services.health_checker.os.stat") as mock_stat,
-        ):
-            # Mock healthy system resources with all required attributes
-            mock_memory.return_value = Mock(
-                percent=60.0,
-                available=4 * 1024 * 1024 * 1024,
-                total=8 * 1024 * 1024 * 1024,
-                used=4 * 1024 * 1024 * 1024,
-            )
-            mock_disk.return_value = Mock(
-                percent=70.0,
-                free=100 * 1024 * 1024 * 1024,
-                total=200 * 1024 * 1024 * 1024,
-                used=100 * 1024 * 1024 * 1024,
-            )
-            # Mock file stat for model files
-            mock_stat.return_value = Mock(st_size=1024, st_mtime=1640995200)
+        psutil_readings(50.0, HEALTHY_MEM, HEALTHY_DISK)
+        install_fake_fs(monkeypatch, MODEL_FILES)
 
-            result = await health_checker.run_all_checks()
+        result = await health_checker.run_all_checks()
 
-            # Test passes if health checks complete without error
-            assert result["status"] == "healthy"
-            assert "summary" in result
+        # Test passes if health checks complete without error
+        assert result["status"] == "healthy"
+        assert "summary" in result
 
     def test_health_status_enum(self):
         """Test HealthStatus enum values."""
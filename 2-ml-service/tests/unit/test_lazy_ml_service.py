@@ -0,0 +1,429 @@
+"""
+Unit tests for the lazy-loading ML service.
+
+Tests serving-path behavior that does not need trained artifacts:
+- Micro-batching of concurrent predictions
+- Prediction kernels compiled from the fitted models
+- Lock-free fast path for already-loaded components
+- Cached health probe results
+- Prediction response construction
+- Shared model registry
+- Optional background warmup
+- Idle model eviction
+- Deferred construction of the shared instance
+"""
+
+import asyncio
+import os
+import pickle
+import time
+from unittest.mock import MagicMock, Mock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.core.exceptions import ConfigurationError
+from app.services import _model_registry
+from app.services.lazy_ml_service import FastMLService, LazyMLService
+
+
+def _mock_kernel(probability):
+    """Create a mock prediction kernel returning a fixed survival probability."""
+    return Mock(side_effect=lambda X: np.full(len(X), probability))
+
+
+@pytest.fixture
+def service(tmp_path):
+    """Create LazyMLService over an empty models directory."""
+    return LazyMLService(models_dir=str(tmp_path))
+
+
+@pytest.fixture
+def model_bundle(tmp_path):
+    """Write a models.joblib bundle of fitted models and evict it after the test."""
+    import joblib
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.tree import DecisionTreeClassifier
+
+    X, y = np.array([[0.0], [1.0], [2.0], [3.0]]), np.array([0, 0, 1, 1])
+    bundle = {
+        "lr": LogisticRegression().fit(X, y),
+        "dt": DecisionTreeClassifier().fit(X, y),
+        "enc": {"sex": "encoder"},
+    }
+    path = tmp_path / "models.joblib"
+    joblib.dump(bundle, path, compress=0)
+    yield bundle
+    _model_registry.evict(str(path))
+
+
+class TestMicroBatching:
+    """Test coalescing of concurrent predictions into one model call."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_rows_share_one_model_call(self, service):
+        """Test that concurrent requests are predicted in a single batch."""
+        lr_predict, dt_predict = _mock_kernel(0.75), _mock_kernel(0.25)
+        rows = [np.array([[float(age)]]) for age in range(5)]
+
+        results = await asyncio.gather(
+            *(
+                service._predict_probabilities(lr_predict, dt_predict, row)
+                for row in rows
+            )
+        )
+
+        assert results == [(0.75, 0.25)] * 5
+        assert lr_predict.call_count == 1
+        assert dt_predict.call_count == 1
+        assert len(lr_predict.call_args[0][0]) == 5
+
+    @pytest.mark.asyncio
+    async def test_model_error_propagates_to_every_request(self, service):
+        """Test that a failing batch raises in each waiting request."""
+        lr_predict = Mock(side_effect=ValueError("bad features"))
+        rows = [np.array([[30.0]]) for _ in range(3)]
+
+        results = await asyncio.gather(
+            *(service._predict_probabilities(lr_predict, Mock(), row) for row in rows),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert service._pending == []
+
+    def test_timer_from_a_closed_loop_is_rescheduled(self, service):
+        """Test that a batch left pending by a closed loop does not block the next."""
+        lr_predict, dt_predict = _mock_kernel(0.75), _mock_kernel(0.25)
+        row = np.array([[30.0]])
+
+        async def abandon():
+            task = asyncio.ensure_future(
+                service._predict_probabilities(lr_predict, dt_predict, row)
+            )
+            await asyncio.sleep(0)  # Queue the row and schedule the flush
+            task.cancel()
+
+        async def predict():
+            return await asyncio.wait_for(
+                service._predict_probabilities(lr_predict, dt_predict, row), 1
+            )
+
+        # The first loop closes before its flush timer fires
+        asyncio.run(abandon())
+        assert service._flush_handle is not None
+
+        assert asyncio.run(predict()) == (0.75, 0.25)
+        assert service._pending == []
+
+
+class TestLazyLoading:
+    """Test the double-checked locking around lazy loaders."""
+
+    def test_loaded_models_skip_lock(self, service):
+        """Test that already-loaded models are returned without locking."""
+        service._lr_model, service._dt_model = Mock(), Mock()
+        service._label_encoders = {}
+        service._models_loaded = True
+        service._lock = MagicMock()
+
+        models = service._load_models()
+
+        assert models == (service._lr_model, service._dt_model, {})
+        service._lock.__enter__.assert_not_called()
+
+    def test_model_bundle_is_preferred(self, service, model_bundle):
+        """Test that models.joblib is used instead of the individual pickles."""
+        lr_model, dt_model, label_encoders = service._load_models()
+
+        assert type(lr_model) is type(model_bundle["lr"])
+        assert type(dt_model) is type(model_bundle["dt"])
+        assert label_encoders == {"sex": "encoder"}
+        X = np.array([[0.0], [1.0], [2.0], [3.0]])
+        assert list(service._kernels[1](X)) == [0.0, 0.0, 1.0, 1.0]
+
+    def test_failed_load_raises_configuration_error(self, service):
+        """Test that missing model files surface as ConfigurationError."""
+        with pytest.raises(ConfigurationError):
+            service._load_models()
+
+        assert service._models_loaded is False
+
+
+class TestHealthProbe:
+    """Test that is_healthy avoids repeated disk access."""
+
+    def test_encoders_exists_check_is_cached(self, service):
+        """Test that the label encoders stat is reused between probes."""
+        with patch(
+            "app.services.lazy_ml_service.os.path.exists", return_value=True
+        ) as mock_exists:
+            first = service.is_healthy()
+            second = service.is_healthy()
+
+        assert first["preprocessor_ready"] is True
+        assert second["preprocessor_ready"] is True
+        assert mock_exists.call_count == 3  # models_dir twice, encoders once
+
+    def test_failed_accuracy_load_is_not_retried_immediately(self, service):
+        """Test that a missing evaluation file is not re-read on every probe."""
+        with patch.object(service.logger, "warning") as mock_warning:
+            first = service.is_healthy()["model_accuracy"]
+            second = service.is_healthy()["model_accuracy"]
+
+        assert first == second
+        assert "ensemble" in first
+        assert mock_warning.call_count == 1
+
+
+class TestPredictSurvival:
+    """Test response construction from model probabilities."""
+
+    @pytest.fixture
+    def service(self, tmp_path):
+        """Create LazyMLService with preloaded mock components."""
+        service = LazyMLService(models_dir=str(tmp_path))
+        service._preprocessor = Mock()
+        service._preprocessor.preprocess_single_passenger.return_value = pd.DataFrame(
+            [{"age": 30.0}]
+        )
+        service._preprocessor_loaded = True
+        service._label_encoders = {}
+        service._models_loaded = True
+        return service
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "lr_prob, dt_prob, ensemble_label, confidence_level",
+        [
+            (0.9, 0.95, "survived", "high"),
+            (0.2, 0.5, "did_not_survive", "medium"),
+            (0.1, 0.9, "did_not_survive", "low"),
+        ],
+    )
+    async def test_labels_and_confidence_level(
+        self, service, lr_prob, dt_prob, ensemble_label, confidence_level
+    ):
+        """Test prediction labels and confidence buckets."""
+        service._kernels = (_mock_kernel(lr_prob), _mock_kernel(dt_prob))
+
+        response = await service.predict_survival({"age": 30.0})
+
+        lr_result = response.individual_models["logistic_regression"]
+        assert lr_result.probability == pytest.approx(lr_prob)
+        assert lr_result.prediction == (
+            "survived" if lr_prob > 0.5 else "did_not_survive"
+        )
+        assert response.ensemble_result.prediction == ensemble_label
+        assert response.ensemble_result.confidence_level == confidence_level
+
+
+class TestModelRegistry:
+    """Test the process-wide registry of loaded model artifacts."""
+
+    @pytest.fixture
+    def artifact(self, tmp_path):
+        """Write a small pickled artifact and evict it after the test."""
+        path = tmp_path / "model.pkl"
+        path.write_bytes(pickle.dumps({"version": 1}))
+        yield str(path)
+        _model_registry.evict(str(path))
+
+    def test_same_path_returns_shared_instance(self, artifact):
+        """Test that repeated loads of one file return the same object."""
+        first = _model_registry.get_model(artifact)
+        second = _model_registry.get_model(os.path.relpath(artifact))
+
+        assert first is second
+        assert first == {"version": 1}
+
+    def test_modified_file_is_reloaded(self, artifact):
+        """Test that a changed modification time invalidates the entry."""
+        first = _model_registry.get_model(artifact)
+
+        with open(artifact, "wb") as f:
+            pickle.dump({"version": 2}, f)
+        stat = os.stat(artifact)
+        os.utime(artifact, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        second = _model_registry.get_model(artifact)
+        assert second is not first
+        assert second == {"version": 2}
+
+    def test_evict_forces_reload(self, artifact):
+        """Test that evicted artifacts are loaded again from disk."""
+        first = _model_registry.get_model(artifact)
+        _model_registry.evict(artifact)
+
+        assert _model_registry.get_model(artifact) is not first
+
+    def test_json_artifacts_are_parsed_once(self, tmp_path):
+        """Test that evaluation results are parsed once and shared."""
+        path = tmp_path / "evaluation_results.json"
+        path.write_text('{"ensemble_accuracy": 0.82}')
+
+        try:
+            first = _model_registry.get_json(str(path))
+            assert first == {"ensemble_accuracy": 0.82}
+            assert _model_registry.get_json(str(path)) is first
+        finally:
+            _model_registry.evict(str(path))
+
+
+class TestIdleEviction:
+    """Test unloading of models after a period without predictions."""
+
+    @pytest.fixture
+    def service(self, tmp_path):
+        """Create LazyMLService with loaded models backed by a registry entry."""
+        path = tmp_path / "logistic_model.pkl"
+        path.write_bytes(pickle.dumps({"weights": [1.0]}))
+
+        service = LazyMLService(models_dir=str(tmp_path))
+        service._lr_model = _model_registry.get_model(str(path))
+        service._kernels = (_mock_kernel(0.5), _mock_kernel(0.5))
+        service._model_paths = [str(path)]
+        service._models_loaded = True
+        service._idle_ttl = 300.0
+        yield service
+        _model_registry.evict(str(path))
+
+    def test_idle_models_are_unloaded(self, service):
+        """Test that models idle past the TTL are dropped everywhere."""
+        path = os.path.abspath(service._model_paths[0])
+        service._last_used = time.monotonic() - 301.0
+
+        service._evict_if_idle()
+
+        assert service._models_loaded is False
+        assert service._kernels is None
+        assert service._lr_model is None
+        assert path not in _model_registry._REGISTRY
+
+    def test_recently_used_models_are_kept(self, service):
+        """Test that models in use stay loaded and are checked again later."""
+        service._last_used = time.monotonic()
+
+        with patch.object(service, "_schedule_idle_check") as schedule:
+            service._evict_if_idle()
+
+        assert service._models_loaded is True
+        schedule.assert_called_once()
+
+    def test_freshly_loaded_models_are_kept(self, tmp_path, model_bundle):
+        """Test that models loaded without a prediction are not idle yet."""
+        service = LazyMLService(models_dir=str(tmp_path))
+        service._idle_ttl = 300.0
+
+        with patch.object(service, "_schedule_idle_check"):
+            service._load_models()
+            service._evict_if_idle()
+
+        assert service._models_loaded is True
+        assert service._kernels is not None
+
+    def test_zero_ttl_disables_eviction(self, service):
+        """Test that MODEL_IDLE_SECS=0 never starts the idle timer."""
+        service._idle_ttl = 0.0
+
+        with patch("app.services.lazy_ml_service.threading.Timer") as timer:
+            service._schedule_idle_check()
+
+        timer.assert_not_called()
+
+
+class TestLazySingleton:
+    """Test deferred construction of the shared service instance."""
+
+    def test_instance_created_once_on_first_use(self, monkeypatch):
+        """Test that the shared service is built on first call and reused."""
+        from app.services import lazy_ml_service
+
+        monkeypatch.setattr(lazy_ml_service, "_lazy_instance", None)
+        with patch.object(lazy_ml_service, "LazyMLService") as service_cls:
+            first = lazy_ml_service.get_lazy_ml_service()
+            second = lazy_ml_service.get_lazy_ml_service()
+
+        service_cls.assert_called_once_with()
+        assert first is second is service_cls.return_value
+
+
+class TestEagerWarmup:
+    """Test optional background model warmup at startup."""
+
+    @pytest.fixture
+    def service(self, tmp_path):
+        """Create FastMLService delegating to a mocked lazy service."""
+        delegate = MagicMock(models_dir=str(tmp_path))
+        return FastMLService(delegate_factory=lambda: delegate)
+
+    @pytest.mark.asyncio
+    async def test_warmup_disabled_by_default(self, service, monkeypatch):
+        """Test that startup does not load models unless enabled."""
+        monkeypatch.delenv("EAGER_WARMUP", raising=False)
+
+        with patch("app.services.lazy_ml_service.threading.Thread") as thread:
+            await service.load_models()
+
+        thread.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_warmup_loads_in_background_thread(self, service, monkeypatch):
+        """Test that EAGER_WARMUP=1 starts a daemon warmup thread."""
+        monkeypatch.setenv("EAGER_WARMUP", "1")
+
+        with patch("app.services.lazy_ml_service.threading.Thread") as thread:
+            await service.load_models()
+
+        thread.assert_called_once_with(
+            target=service._warmup, name="ml-warmup", daemon=True
+        )
+        thread.return_value.start.assert_called_once()
+
+    def test_warmup_failure_is_swallowed(self, service):
+        """Test that warmup errors are left for the request path to surface."""
+        service._delegate._load_models.side_effect = ConfigurationError("boom")
+
+        service._warmup()
+
+        service._delegate._load_preprocessor.assert_called_once()
+        service._delegate._load_model_accuracy.assert_not_called()
+
+
+class TestCompiledKernels:
+    """Test prediction kernels compiled from fitted sklearn models."""
+
+    @pytest.fixture
+    def training_data(self):
+        """Create a noisy binary classification problem."""
+        rng = np.random.default_rng(0)
+        X = rng.normal(size=(200, 4))
+        y = (X[:, 0] + X[:, 1] + rng.normal(size=200) > 0).astype(int)
+        return X, y
+
+    def test_logistic_kernel_matches_predict_proba(self, training_data):
+        """Test that the logistic kernel equals predict_proba."""
+        from sklearn.linear_model import LogisticRegression
+        from app.services._model_registry import compile_logistic
+
+        X, y = training_data
+        model = LogisticRegression().fit(X, y)
+
+        np.testing.assert_allclose(
+            compile_logistic(model)(X), model.predict_proba(X)[:, 1]
+        )
+
+    def test_tree_kernel_matches_predict_proba(self, training_data):
+        """Test that the decision tree walk equals predict_proba."""
+        from sklearn.tree import DecisionTreeClassifier
+        from app.services._model_registry import compile_decision_tree
+
+        X, y = training_data
+        model = DecisionTreeClassifier(
+            random_state=0, max_depth=10, min_samples_split=20
+        ).fit(X, y)
+
+        np.testing.assert_allclose(
+            compile_decision_tree(model)(X), model.predict_proba(X)[:, 1]
+        )
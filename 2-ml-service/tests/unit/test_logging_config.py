@@ -0,0 +1,104 @@
+"""
+Unit tests for the background stdout log queue.
+
+Tests that root stream handlers move onto a bounded queue, that stopping the
+queue flushes records and restores the handlers, and that a full queue drops
+records instead of blocking.
+"""
+
+import io
+import logging
+import queue
+
+import pytest
+
+from app.core.logging_config import (
+    _DroppingQueueHandler,
+    start_log_queue,
+    stop_log_queue,
+)
+
+
+@pytest.fixture
+def root_stream():
+    """Give the root logger a temporary StreamHandler writing to a buffer."""
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    root.handlers = [handler]
+    root.setLevel(logging.INFO)
+    yield stream, handler
+    root.handlers = saved_handlers
+    root.setLevel(saved_level)
+
+
+class TestStartLogQueue:
+    """Test moving root logging onto the queue and back."""
+
+    def test_without_stream_handler_returns_none(self, root_stream):
+        """Test that nothing is started when the root has no stream handler."""
+        logging.getLogger().handlers = []
+
+        assert start_log_queue() is None
+        assert logging.getLogger().handlers == []
+
+    def test_stop_flushes_and_restores_handlers(self, root_stream):
+        """Test that records are written and handlers restored on stop."""
+        stream, handler = root_stream
+        root = logging.getLogger()
+
+        stop = start_log_queue()
+        assert handler not in root.handlers
+        assert any(isinstance(h, _DroppingQueueHandler) for h in root.handlers)
+
+        logging.getLogger("queued").info("through the queue")
+        stop()
+
+        assert handler in root.handlers
+        assert not any(isinstance(h, _DroppingQueueHandler) for h in root.handlers)
+        assert "through the queue" in stream.getvalue()
+
+        logging.getLogger("direct").info("after shutdown")
+        assert "after shutdown" in stream.getvalue()
+
+    def test_second_start_keeps_running_listener(self, root_stream):
+        """Test that starting again returns the running listener's stop."""
+        stream, handler = root_stream
+        root = logging.getLogger()
+
+        stop = start_log_queue()
+        assert start_log_queue() is stop
+        assert sum(isinstance(h, _DroppingQueueHandler) for h in root.handlers) == 1
+
+        logging.getLogger("queued").info("stopped module-wide")
+        stop_log_queue()
+
+        assert handler in root.handlers
+        assert not any(isinstance(h, _DroppingQueueHandler) for h in root.handlers)
+        assert "stopped module-wide" in stream.getvalue()
+        # Stopping again, through either function, is a no-op
+        stop()
+        stop_log_queue()
+        assert root.handlers.count(handler) == 1
+
+
+class TestDroppingQueueHandler:
+    """Test the queue handler's behavior when the queue is full."""
+
+    def test_full_queue_drops_records(self):
+        """Test that records logged into a full queue are dropped silently."""
+        log_queue = queue.Queue(maxsize=1)
+        handler = _DroppingQueueHandler(log_queue)
+        logger = logging.getLogger("dropping")
+        logger.propagate = False
+        logger.addHandler(handler)
+        try:
+            logger.warning("kept")
+            logger.warning("dropped")
+        finally:
+            logger.removeHandler(handler)
+            logger.propagate = True
+
+        assert log_queue.qsize() == 1
+        assert log_queue.get_nowait().getMessage() == "kept"
@@ -0,0 +1,139 @@
+"""
+Unit tests for the eager-loading ML service.
+
+Tests behavior that does not need trained artifacts:
+- Models directory validation
+- Health status before and after loading
+- Prediction response construction from the compiled kernels
+- Debug payloads gated on the service logger
+"""
+
+import logging
+from unittest.mock import MagicMock, Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+import structlog
+
+from app.core.exceptions import (
+    ConfigurationError,
+    ModelNotLoadedError,
+    PredictionError,
+)
+from app.core.logging_config import get_logger
+from app.services._model_registry import FEATURE_COLUMNS
+from app.services.ml_service import MLService
+
+
+def _kernel(probability):
+    """Create a prediction kernel returning a fixed survival probability."""
+    return lambda X: np.full(len(X), probability)
+
+
+@pytest.fixture
+def service(tmp_path):
+    """Create MLService wired to stub kernels instead of loaded models."""
+    service = MLService(models_dir=str(tmp_path))
+    service.logger = MagicMock()
+    service.logger.isEnabledFor.return_value = False
+    service.preprocessor = Mock()
+    service.preprocessor.preprocess_single_passenger.return_value = pd.DataFrame(
+        [[3, 1, 22.0]]
+    )
+    service.lr_predict = _kernel(0.9)
+    service.dt_predict = _kernel(0.7)
+    service.model_accuracy = {"ensemble": 0.82}
+    service.is_loaded = True
+    return service
+
+
+class TestLoading:
+    """Test model loading failures and pre-load state."""
+
+    @pytest.mark.asyncio
+    async def test_missing_models_dir_raises_configuration_error(self, tmp_path):
+        """Test that a missing models directory is a configuration error."""
+        service = MLService(models_dir=str(tmp_path / "missing"))
+
+        with pytest.raises(ConfigurationError):
+            await service.load_models()
+
+        assert service.is_loaded is False
+
+    def test_unloaded_service_is_unhealthy(self, tmp_path):
+        """Test health status and feature columns before loading."""
+        service = MLService(models_dir=str(tmp_path))
+
+        assert service.is_healthy() == {
+            "status": "unhealthy",
+            "models_loaded": False,
+            "preprocessor_ready": False,
+            "model_accuracy": None,
+        }
+        assert service.get_feature_columns() == list(FEATURE_COLUMNS)
+
+
+class TestPrediction:
+    """Test prediction results built from the compiled kernels."""
+
+    @pytest.mark.asyncio
+    async def test_prediction_combines_both_models(self, service):
+        """Test individual, ensemble and confidence values of a prediction."""
+        result = await service.predict_survival({"pclass": 3})
+
+        assert result.individual_models["logistic_regression"].probability == 0.9
+        assert result.individual_models["decision_tree"].prediction == "survived"
+        assert result.ensemble_result.probability == pytest.approx(0.8)
+        assert result.ensemble_result.confidence == pytest.approx(0.6)
+        assert result.ensemble_result.confidence_level == "medium"
+
+    @pytest.mark.asyncio
+    async def test_unloaded_service_rejects_predictions(self, service):
+        """Test that predicting before loading raises ModelNotLoadedError."""
+        service.is_loaded = False
+
+        with pytest.raises(ModelNotLoadedError):
+            await service.predict_survival({"pclass": 3})
+
+    @pytest.mark.asyncio
+    async def test_kernel_failure_raises_prediction_error(self, service):
+        """Test that inference errors are wrapped in PredictionError."""
+        service.lr_predict = Mock(side_effect=ValueError("bad features"))
+
+        with pytest.raises(PredictionError):
+            await service.predict_survival({"pclass": 3})
+
+    @pytest.mark.asyncio
+    async def test_debug_payloads_follow_service_logger(self, service):
+        """Test that debug logging is gated on the service's own logger."""
+        await service.predict_survival({"pclass": 3})
+        service.logger.isEnabledFor.assert_called_once_with(logging.DEBUG)
+        service.logger.debug.assert_not_called()
+
+        service.logger.isEnabledFor.return_value = True
+        await service.predict_survival({"pclass": 3})
+        assert service.logger.debug.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_prediction_with_unconfigured_structlog(self, service):
+        """Test predicting with a real logger before logging is configured."""
+        saved_config = structlog.get_config()
+        structlog.reset_defaults()
+        try:
+            service.logger = get_logger("ml_service")
+            result = await service.predict_survival({"pclass": 3})
+        finally:
+            structlog.configure(**saved_config)
+
+        assert result.ensemble_result.probability == pytest.approx(0.8)
+
+    def test_loaded_service_is_healthy(self, service):
+        """Test health status and feature columns once loaded."""
+        service.preprocessor.get_feature_columns.return_value = ["pclass"]
+
+        health = service.is_healthy()
+
+        assert health["status"] == "healthy"
+        assert health["model_accuracy"] == {"ensemble": 0.82}
+        assert service.get_feature_columns() == ["pclass"]
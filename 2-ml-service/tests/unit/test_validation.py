@@ -10,15 +10,17 @@ Tests comprehensive input validation including:
 - XSS prevention
 """
 
-import pytest
 from unittest.mock import patch
 
+import pytest
+
+from app.core.exceptions import ValidationError
 from app.utils.validation import (
     InputSanitizer,
     validate_passenger_input,
     validate_query_parameters,
 )
-from app.core.exceptions import ValidationError
+from tests.payloads import INVALID_CASES
 
 
 class TestInputSanitizer:
@@ -45,6 +47,10 @@ class TestInputSanitizer:
 
         assert "invalid_characters" in str(exc_info.value.details)
 
+    def test_sanitize_string_not_html_escaped(self, sanitizer):
+        """Test that harmless markup characters are preserved, not escaped."""
+        assert sanitizer.sanitize_string("A&B <1>", "test_field") == "A&B <1>"
+
     def test_sanitize_string_sql_injection(self, sanitizer):
         """Test SQL injection prevention."""
         malicious_inputs = [
@@ -74,11 +80,38 @@ class TestInputSanitizer:
             with pytest.raises(ValidationError):
                 sanitizer.sanitize_string(xss_input, "test_field")
 
+    def test_sanitize_string_xss_unicode_whitespace(self, sanitizer):
+        """Test that event handlers padded with non-ASCII whitespace are rejected."""
+        for xss_input in ("onclick\xa0=x", "onclick\u3000=alert(1)"):
+            with pytest.raises(ValidationError) as exc_info:
+                sanitizer.sanitize_string(xss_input, "test_field")
+
+            assert exc_info.value.details["issue"] == "invalid_characters"
+
     def test_sanitize_string_suspicious_chars(self, sanitizer):
         """Test removal of suspicious control characters."""
         with pytest.raises(ValidationError):
             sanitizer.sanitize_string("test\x00\x01\x1f", "test_field")
 
+    def test_sanitize_string_rejection_issue(self, sanitizer):
+        """Test that the fused rejection scan reports the matching issue."""
+        expected_issues = {
+            "ok\x07": "control_characters",
+            "x' OR 1": "invalid_characters",
+            "onload=run()": "invalid_characters",
+        }
+
+        for value, issue in expected_issues.items():
+            with pytest.raises(ValidationError) as exc_info:
+                sanitizer.sanitize_string(value, "test_field")
+
+            assert exc_info.value.details["issue"] == issue
+
+    def test_sanitize_string_unicode_normalization(self, sanitizer):
+        """Test that non-ASCII input is NFKC-normalized."""
+        assert sanitizer.sanitize_string("\uff4d\uff41\uff4c\uff45", "sex") == "male"
+        assert sanitizer.sanitize_string("caf\u00e9", "name") == "caf\u00e9"
+
     def test_sanitize_string_excessive_whitespace(self, sanitizer):
         """Test handling of excessive whitespace."""
         result = sanitizer.sanitize_string(
@@ -89,6 +122,9 @@ class TestInputSanitizer:
             result == "test with     spaces"
         )  # Regex only removes 10+ consecutive spaces
 
+        # Runs of other whitespace are collapsed too
+        assert sanitizer.sanitize_string("a" + "\t" * 10 + "b", "test_field") == "a b"
+
     def test_sanitize_string_length_validation(self, sanitizer):
         """Test string length validation."""
         # Test empty string after sanitization
@@ -121,6 +157,11 @@ class TestInputSanitizer:
         # Test fare bounds
         assert sanitizer.validate_numeric_bounds(50.5, "fare") == 50.5
 
+    def test_bounds_keep_their_mapping_shape(self, sanitizer):
+        """Test that the public bounds map each field to min/max/typical_max."""
+        assert sanitizer.bounds["age"] == {"min": 0, "max": 120, "typical_max": 80}
+        assert sanitizer.bounds["parch"]["typical_max"] == 9
+
     def test_validate_numeric_bounds_out_of_range(self, sanitizer):
         """Test numeric bounds validation with out-of-range values."""
         # Age too high
@@ -181,6 +222,16 @@ class TestInputSanitizer:
         anomalies = sanitizer.detect_anomalies(normal_data)
         assert len(anomalies) == 0
 
+    def test_detect_anomalies_multiple(self, sanitizer):
+        """Test that every anomaly bit set is reported, in a stable order."""
+        data = {"pclass": 3, "age": 5, "fare": 150.0, "sibsp": 8, "parch": 4}
+
+        assert sanitizer.detect_anomalies(data) == [
+            "child_high_fare",
+            "large_family_size",
+            "third_class_high_fare",
+        ]
+
     def test_detect_anomalies_suspicious_patterns(self, sanitizer):
         """Test anomaly detection with suspicious patterns."""
         # Child with high fare
@@ -246,6 +297,38 @@ class TestInputSanitizer:
         assert isinstance(result["sibsp"], int)
         assert result["sibsp"] == 1
 
+    def test_coerce_int_string_forms(self, sanitizer):
+        """Test integer coercion of digit, decimal and signed strings."""
+        assert sanitizer._coerce_int("3", "parch") == 3
+        assert sanitizer._coerce_int("2.0", "parch") == 2
+        assert sanitizer._coerce_int("-1", "parch") == -1
+
+        with pytest.raises(ValidationError):
+            sanitizer._coerce_int("\u00b2", "parch")  # isdigit() but not int()
+
+    def test_sanitize_and_validate_drops_unknown_fields(self, sanitizer):
+        """Test that fields without a validation handler are not passed on."""
+        result = sanitizer.sanitize_and_validate(
+            {"sex": "male", "age": 30.0, "name": "Smith"}
+        )
+
+        assert result == {"sex": "male", "age": 30.0}
+
+    def test_sanitize_and_validate_normalizes_categoricals(self, sanitizer):
+        """Test that categorical strings are case- and whitespace-normalized."""
+        result = sanitizer.sanitize_and_validate(
+            {"sex": "  Female ", "embarked": "s ", "pclass": "2"}
+        )
+
+        assert result == {"sex": "female", "embarked": "S", "pclass": 2}
+
+    def test_sanitize_and_validate_rejects_injection_in_categorical(self, sanitizer):
+        """Test that injection payloads in categorical fields are rejected."""
+        with pytest.raises(ValidationError) as exc_info:
+            sanitizer.sanitize_and_validate({"sex": "male'; DROP TABLE users;--"})
+
+        assert exc_info.value.details["field"] == "sex"
+
     def test_sanitize_and_validate_failure(self, sanitizer):
         """Test validation failure with invalid data."""
         invalid_data = {
@@ -292,11 +375,17 @@ class TestValidationFunctions:
         assert result["sex"] == valid_passenger_data["sex"]
         assert result["age"] == valid_passenger_data["age"]
 
-    def test_validate_passenger_input_failure(self, invalid_passenger_data):
+    @pytest.mark.parametrize("invalid_data", INVALID_CASES)
+    def test_validate_passenger_input_failure(self, invalid_data):
         """Test passenger input validation failures."""
-        for invalid_data in invalid_passenger_data:
-            with pytest.raises(ValidationError):
-                validate_passenger_input(invalid_data)
+        with pytest.raises(ValidationError):
+            validate_passenger_input(invalid_data)
+
+    @pytest.mark.parametrize("sibsp", ["inf", float("inf"), "-inf"])
+    def test_validate_passenger_input_infinite_int(self, valid_passenger_data, sibsp):
+        """Test that infinite integer fields are a ValidationError, not a crash."""
+        with pytest.raises(ValidationError):
+            validate_passenger_input({**valid_passenger_data, "sibsp": sibsp})
 
     def test_validate_query_parameters_success(self):
         """Test successful query parameter validation."""
@@ -330,3 +419,24 @@ class TestValidationFunctions:
         assert result["detailed"] is True
         assert result["count"] == 10
         assert result["name"] == "test"
+
+    def test_validate_query_parameters_matches_sanitize_string(self):
+        """Test that the batched scan gives the same results as per-value sanitization."""
+        sanitizer = InputSanitizer()
+        params = {
+            "name": "  test  ",
+            "wide": "ｊｓｏｎ",
+            "gap": "a" + " " * 12 + "b",
+            "split_a": "x-",
+            "split_b": "-y",
+        }
+
+        result = validate_query_parameters(params)
+
+        assert result == {
+            key: sanitizer.sanitize_string(value, key) for key, value in params.items()
+        }
+
+        for value in ("   ", "a" * 101, "tab\x0bbed"):
+            with pytest.raises(ValidationError):
+                validate_query_parameters({"q": value})